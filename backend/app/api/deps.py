@@ -1,6 +1,95 @@
 """Shared API dependencies."""
 
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.core.database import get_db
 from app.core.security import get_current_user
+from app.models.account import Account
+from app.models.user import User
+from app.services.account_service import AccountService
+from app.services.analytics_service import AnalyticsService
+from app.services.auth_service import AuthService
+from app.services.category_service import CategoryService
+from app.services.chat_service import ChatService
+from app.services.classification_service import ClassificationService
+from app.services.embedding_service import EmbeddingService
+from app.services.import_service import ImportService
+from app.services.rule_service import RuleService
+from app.services.transaction_service import TransactionService
+
+
+# Service providers — FastAPI caches each dependency result per request
+# (use_cache=True is the default), so every handler and sub-dependency shares
+# one instance instead of constructing its own.
+def get_account_service(db: AsyncSession = Depends(get_db)) -> AccountService:
+    return AccountService(db)
+
+
+def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
+    return AuthService(db)
+
+
+def get_analytics_service(db: AsyncSession = Depends(get_db)) -> AnalyticsService:
+    return AnalyticsService(db)
+
+
+def get_category_service(db: AsyncSession = Depends(get_db)) -> CategoryService:
+    return CategoryService(db)
+
+
+def get_chat_service(db: AsyncSession = Depends(get_db)) -> ChatService:
+    return ChatService(db)
+
+
+def get_classification_service(db: AsyncSession = Depends(get_db)) -> ClassificationService:
+    return ClassificationService(db)
+
+
+def get_embedding_service(db: AsyncSession = Depends(get_db)) -> EmbeddingService:
+    return EmbeddingService(db)
+
+
+def get_import_service(db: AsyncSession = Depends(get_db)) -> ImportService:
+    return ImportService(db)
+
+
+def get_rule_service(db: AsyncSession = Depends(get_db)) -> RuleService:
+    return RuleService(db)
+
+
+def get_transaction_service(db: AsyncSession = Depends(get_db)) -> TransactionService:
+    return TransactionService(db)
+
+
+async def get_user_account_ids(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> list[int]:
+    """The current user's account ids, fetched once per request.
+
+    Handlers that filter several queries on account ownership can take this
+    instead of embedding a SELECT-on-accounts subquery in each one: Postgres
+    then plans a plain indexed IN-list rather than a semi-join, and the list
+    is shared across the request thanks to dependency caching.
+    """
+    result = await db.execute(select(Account.id).where(Account.user_id == current_user.id))
+    return list(result.scalars().all())
+
 
-__all__ = ["get_db", "get_current_user"]
+__all__ = [
+    "get_db",
+    "get_current_user",
+    "get_account_service",
+    "get_analytics_service",
+    "get_auth_service",
+    "get_category_service",
+    "get_chat_service",
+    "get_classification_service",
+    "get_embedding_service",
+    "get_import_service",
+    "get_rule_service",
+    "get_transaction_service",
+    "get_user_account_ids",
+]
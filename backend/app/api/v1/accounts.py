@@ -1,9 +1,23 @@
 """Account management API routes."""
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_account_service, get_current_user, get_db
+from app.core.cache import (
+    CACHE_PREFIX,
+    DEFAULT_EXPIRE,
+    cache_get,
+    cache_set,
+    invalidate_user_cache,
+    make_etag,
+)
+from app.models.account import Account
+from app.models.transaction import Transaction
 from app.models.user import User
 from app.schemas.account import (
     AccountCreate,
@@ -13,49 +27,107 @@ from app.schemas.account import (
     CalibrateBalanceRequest,
 )
 from app.services.account_service import AccountService
+from app.services.chat_service import invalidate_account_scope_cache
 
 router = APIRouter()
 
-
-@router.get("", response_model=list[AccountResponse])
+# Pre-compiled adapter: one validate+dump pass over the whole list instead of
+# FastAPI's per-request, field-by-field response_model validation.
+_ACCOUNT_LIST_ADAPTER = TypeAdapter(list[AccountResponse])
+_SUMMARY_ADAPTER = TypeAdapter(AccountSummary)
+
+
+def _summary_key(user_id: int) -> str:
+    # Lives under the user namespace so invalidate_user_cache (called on every
+    # transaction write) clears it alongside the other per-user entries.
+    return f"{CACHE_PREFIX}:user:{user_id}:summary"
+
+
+async def _accounts_etag(db: AsyncSession, user_id: int) -> str:
+    """Cheap version token for the account list (incl. computed balances).
+
+    Balances derive from transactions, so the token covers both tables.
+    """
+    acc_version = (
+        await db.execute(
+            select(func.max(Account.updated_at), func.count(Account.id)).where(
+                Account.user_id == user_id, Account.status == "active"
+            )
+        )
+    ).one()
+    txn_version = (
+        await db.execute(
+            select(func.max(Transaction.updated_at), func.count(Transaction.id)).where(
+                Transaction.account_id.in_(
+                    select(Account.id).where(Account.user_id == user_id)
+                ),
+                Transaction.deleted_at.is_(None),
+            )
+        )
+    ).one()
+    return make_etag(user_id, "accounts", *acc_version, *txn_version)
+
+
+@router.get("", response_model=None)
 async def list_accounts(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    service: AccountService = Depends(get_account_service),
 ):
     """List all accounts for current user."""
-    service = AccountService(db)
-    return await service.list_accounts(current_user)
+    etag = await _accounts_etag(db, current_user.id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    accounts = await service.list_accounts(current_user)
+    validated = _ACCOUNT_LIST_ADAPTER.validate_python(accounts, from_attributes=True)
+    response = ORJSONResponse(_ACCOUNT_LIST_ADAPTER.dump_python(validated, mode="json"))
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.post("", response_model=AccountResponse, status_code=201)
 async def create_account(
     data: AccountCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: AccountService = Depends(get_account_service),
 ):
     """Create a new bank account."""
-    service = AccountService(db)
-    return await service.create_account(data, current_user)
+    account = await service.create_account(data, current_user)
+    invalidate_account_scope_cache(current_user.id)
+    await invalidate_user_cache(current_user.id)
+    return account
 
 
-@router.get("/summary", response_model=AccountSummary)
+@router.get("/summary", response_model=None)
 async def get_summary(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: AccountService = Depends(get_account_service),
 ):
-    """Get consolidated account summary."""
-    service = AccountService(db)
-    return await service.get_summary(current_user)
+    """Get consolidated account summary.
+
+    Served from a per-user Redis copy between writes — the aggregation runs
+    once per invalidation window, not on every dashboard load.
+    """
+    key = _summary_key(current_user.id)
+    cached = await cache_get(key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    summary = await service.get_summary(current_user)
+    payload = orjson.dumps(_SUMMARY_ADAPTER.dump_python(summary, mode="json"))
+    await cache_set(key, payload, expire=DEFAULT_EXPIRE)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/{account_id}", response_model=AccountResponse)
 async def get_account(
     account_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: AccountService = Depends(get_account_service),
 ):
     """Get a specific account."""
-    service = AccountService(db)
     return await service.get_account(account_id, current_user)
 
 
@@ -64,11 +136,13 @@ async def update_account(
     account_id: int,
     data: AccountUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: AccountService = Depends(get_account_service),
 ):
     """Update an account."""
-    service = AccountService(db)
-    return await service.update_account(account_id, data, current_user)
+    account = await service.update_account(account_id, data, current_user)
+    invalidate_account_scope_cache(current_user.id)
+    await invalidate_user_cache(current_user.id)
+    return account
 
 
 @router.post("/{account_id}/calibrate", response_model=AccountResponse)
@@ -76,19 +150,21 @@ async def calibrate_balance(
     account_id: int,
     data: CalibrateBalanceRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: AccountService = Depends(get_account_service),
 ):
     """Calibrate account balance from a known balance at a specific date."""
-    service = AccountService(db)
-    return await service.calibrate_balance(account_id, current_user, data.date, data.amount)
+    result = await service.calibrate_balance(account_id, current_user, data.date, data.amount)
+    await invalidate_user_cache(current_user.id)
+    return result
 
 
 @router.delete("/{account_id}", status_code=204)
 async def archive_account(
     account_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: AccountService = Depends(get_account_service),
 ):
     """Archive an account."""
-    service = AccountService(db)
     await service.archive_account(account_id, current_user)
+    invalidate_account_scope_cache(current_user.id)
+    await invalidate_user_cache(current_user.id)
@@ -1,10 +1,18 @@
 """AI assistant API routes."""
 
+import json
+import random
+
 import structlog
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_chat_service, get_current_user, get_db
+from app.core.cache import cache_delete, cache_get, cache_set, make_etag
+from app.models.conversation import Conversation
 from app.models.user import User
 from app.schemas.ai import (
     AIConfigUpdate,
@@ -17,22 +25,36 @@ from app.schemas.ai import (
     QueryExecuteRequest,
 )
 from app.services.ai_config import set_provider
-from app.services.chat_service import ChatService, convert_raw_to_placeholders
+from app.services.chat_service import ChatService, chat_stream, convert_raw_to_placeholders
 from app.services.metamodel import metamodel_prompt_json
 from app.services.query_engine import QueryContext, execute_query
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# The metamodel is static (it only changes on deploy), so serialize it once at
+# import time and serve the pre-encoded bytes — no per-request encoding work.
+_METAMODEL_BYTES = json.dumps(metamodel_prompt_json(), ensure_ascii=False).encode("utf-8")
+
+# Pre-compiled adapters — avoid FastAPI's per-row response_model validation.
+_CONVERSATION_LIST_ADAPTER = TypeAdapter(list[ConversationResponse])
+_MESSAGE_LIST_ADAPTER = TypeAdapter(list[MessageResponse])
+
+# Provider status is polled by the frontend but hits the LLM provider over the
+# network; cache it briefly (jittered TTL to avoid stampedes) and keep a
+# longer-lived last-known-good copy to serve when the provider errors out.
+_PROVIDER_STATUS_KEY = "ai:provider_status"
+_PROVIDER_STATUS_STALE_KEY = "ai:provider_status:stale"
+_PROVIDER_STATUS_STALE_TTL = 3600
+
 
 @router.post("/chat", response_model=ChatResponse)
 async def chat(
     message: ChatMessage,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ChatService = Depends(get_chat_service),
 ):
     """Send a message to the AI assistant."""
-    service = ChatService(db)
     try:
         result = await service.chat(
             user=current_user,
@@ -48,53 +70,104 @@ async def chat(
         debug_info = None
         if message.debug:
             debug_info = {"error": error_msg}
-        return ChatResponse(
-            conversation_id=message.conversation_id or 0,
-            message="",
-            error=error_msg,
-            debug=debug_info,
+        # Pre-shaped dict straight to orjson — no Pydantic re-validation on the
+        # error path, which dominates when the LLM provider is down.
+        return ORJSONResponse(
+            {
+                "conversation_id": message.conversation_id or 0,
+                "message": "",
+                "charts": [],
+                "metadata": None,
+                "error": error_msg,
+                "debug": debug_info,
+            }
         )
 
 
-@router.get("/conversations", response_model=list[ConversationResponse])
+@router.post("/chat/stream")
+async def chat_stream_endpoint(
+    message: ChatMessage,
+    current_user: User = Depends(get_current_user),
+):
+    """Stream the AI assistant response as Server-Sent Events.
+
+    Emits {"type": "meta"} with the conversation id, {"type": "delta"} frames
+    as the LLM generates, then a final {"type": "done"} frame with the same
+    payload shape as POST /chat (message with chart placeholders + charts).
+    """
+    return StreamingResponse(
+        chat_stream(
+            user=current_user,
+            content=message.content,
+            conversation_id=message.conversation_id,
+            account_ids=message.account_ids,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/conversations", response_model=None)
 async def list_conversations(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    service: ChatService = Depends(get_chat_service),
 ):
     """List all conversations for current user."""
-    service = ChatService(db)
+    # Cheap version token (one aggregate query) → 304 when the client is current.
+    version = (
+        await db.execute(
+            select(func.max(Conversation.updated_at), func.count(Conversation.id)).where(
+                Conversation.user_id == current_user.id
+            )
+        )
+    ).one()
+    etag = make_etag(current_user.id, "conversations", *version)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
     conversations = await service.list_conversations(current_user)
-    return conversations
+    validated = _CONVERSATION_LIST_ADAPTER.validate_python(conversations, from_attributes=True)
+    response = ORJSONResponse(_CONVERSATION_LIST_ADAPTER.dump_python(validated, mode="json"))
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.get("/conversations/{conversation_id}", response_model=ConversationDetailResponse)
 async def get_conversation(
     conversation_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ChatService = Depends(get_chat_service),
 ):
     """Get conversation with full message history."""
-    service = ChatService(db)
     conv = await service.get_conversation(conversation_id, current_user)
     if not conv:
         raise HTTPException(status_code=404, detail="Conversation non trouvée")
-    messages_out = []
-    for m in conv.messages:
-        content = m.content
-        meta = m.metadata_ or {}
-        charts = meta.get("charts", [])
-        # Convert old stored format (raw with ```dataviz) to placeholders if needed
-        if m.role == "assistant" and charts and "```dataviz" in content:
-            content = convert_raw_to_placeholders(content, charts)
-        messages_out.append(
-            MessageResponse(
-                id=m.id,
-                role=m.role,
-                content=content,
-                metadata=meta,
-                created_at=m.created_at,
-            )
-        )
+
+    def _content(m) -> str:
+        # Convert old stored format (raw with ```dataviz) to placeholders if
+        # needed — check role and charts first to skip the substring scan.
+        if m.role == "assistant":
+            charts = (m.metadata_ or {}).get("charts", [])
+            if charts and "```dataviz" in m.content:
+                return convert_raw_to_placeholders(m.content, charts)
+        return m.content
+
+    # One compiled-validator pass over the whole list instead of per-message
+    # Pydantic model construction.
+    messages_out = _MESSAGE_LIST_ADAPTER.validate_python(
+        [
+            {
+                "id": m.id,
+                "role": m.role,
+                "content": _content(m),
+                "metadata": m.metadata_ or {},
+                "created_at": m.created_at,
+            }
+            for m in conv.messages
+        ]
+    )
     return ConversationDetailResponse(
         id=conv.id,
         title=conv.title,
@@ -107,10 +180,9 @@ async def get_conversation(
 async def delete_conversation(
     conversation_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ChatService = Depends(get_chat_service),
 ):
     """Delete a conversation."""
-    service = ChatService(db)
     deleted = await service.delete_conversation(conversation_id, current_user)
     if not deleted:
         raise HTTPException(status_code=404, detail="Conversation non trouvée")
@@ -120,23 +192,40 @@ async def delete_conversation(
 @router.get("/status", response_model=ProviderStatusResponse)
 async def provider_status(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ChatService = Depends(get_chat_service),
 ):
     """Check if the AI provider is available and return full config."""
-    service = ChatService(db)
-    return await service.check_provider_status()
+    cached = await cache_get(_PROVIDER_STATUS_KEY)
+    if cached:
+        return ProviderStatusResponse(**json.loads(cached))
+
+    try:
+        result = await service.check_provider_status()
+    except Exception as e:
+        # Provider unreachable: serve the last-known-good status rather than 5xx.
+        stale = await cache_get(_PROVIDER_STATUS_STALE_KEY)
+        if stale:
+            logger.warning("provider_status_stale_fallback", error=str(e))
+            return ProviderStatusResponse(**{**json.loads(stale), "stale": True})
+        raise
+
+    payload = json.dumps(result).encode("utf-8")
+    await cache_set(_PROVIDER_STATUS_KEY, payload, expire=30 + random.randint(0, 10))
+    await cache_set(_PROVIDER_STATUS_STALE_KEY, payload, expire=_PROVIDER_STATUS_STALE_TTL)
+    return result
 
 
 @router.patch("/config", response_model=ProviderStatusResponse)
 async def update_ai_config(
     payload: AIConfigUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ChatService = Depends(get_chat_service),
 ):
     """Update AI config (e.g. provider) and return refreshed status."""
     if payload.provider is not None:
         set_provider(payload.provider)
-    service = ChatService(db)
+        # Invalidate the cached status so polls reflect the new provider.
+        await cache_delete(_PROVIDER_STATUS_KEY)
     return await service.check_provider_status()
 
 
@@ -145,7 +234,7 @@ async def get_metamodel(
     current_user: User = Depends(get_current_user),
 ):
     """Return the query metamodel (sources, fields, operators) for the Query module."""
-    return metamodel_prompt_json()
+    return Response(content=_METAMODEL_BYTES, media_type="application/json")
 
 
 @router.post("/query")
@@ -153,37 +242,41 @@ async def execute_dataviz_query(
     payload: QueryExecuteRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    service: ChatService = Depends(get_chat_service),
 ):
     """Execute a raw dataviz query and return chart data (interactive Query module)."""
-    service = ChatService(db)
     account_ids = await service._resolve_account_scope(current_user, payload.account_ids)
     if not account_ids:
         raise HTTPException(status_code=400, detail="Aucun compte sélectionné")
     context = QueryContext(user_id=current_user.id, account_ids=account_ids)
     try:
         data, _col_names, sql_text = await execute_query(db, payload.query, context)
-        return {
-            "viz": payload.viz,
-            "data": data,
-            "trace": {
-                "query": payload.query,
+        return ORJSONResponse(
+            {
                 "viz": payload.viz,
-                "sql": sql_text,
-                "row_count": len(data),
-                "error": None,
-            },
-        }
+                "data": data,
+                "trace": {
+                    "query": payload.query,
+                    "viz": payload.viz,
+                    "sql": sql_text,
+                    "row_count": len(data),
+                    "error": None,
+                },
+            }
+        )
     except Exception as e:
         logger.error("query_execute_error", error=str(e))
         error_msg = str(e)
-        return {
-            "viz": payload.viz,
-            "data": [],
-            "trace": {
-                "query": payload.query,
+        return ORJSONResponse(
+            {
                 "viz": payload.viz,
-                "sql": None,
-                "row_count": 0,
-                "error": error_msg,
-            },
-        }
+                "data": [],
+                "trace": {
+                    "query": payload.query,
+                    "viz": payload.viz,
+                    "sql": None,
+                    "row_count": 0,
+                    "error": error_msg,
+                },
+            }
+        )
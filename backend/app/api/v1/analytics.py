@@ -3,31 +3,36 @@
 from datetime import date
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_analytics_service, get_current_user
+from app.core.cache import DEFAULT_EXPIRE, user_scoped_key
 from app.models.user import User
 from app.services.analytics_service import AnalyticsService
 
-router = APIRouter()
+# orjson serializes the large breakdown payloads (floats, dates) several times
+# faster than jsonable_encoder + stdlib json.dumps.
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.get("/by-category")
+@cache(expire=DEFAULT_EXPIRE, key_builder=user_scoped_key)
 async def by_category(
+    request: Request,
     account_id: int | None = None,
     date_from: date | None = None,
     date_to: date | None = None,
     direction: str | None = Query(None, pattern="^(income|expense)$"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: AnalyticsService = Depends(get_analytics_service),
 ):
     """Get amounts broken down by category (including uncategorized).
 
     Returns a list of { category_id, category_name, parent_name, total, count,
     percentage } entries, ordered by |total| desc.
     """
-    service = AnalyticsService(db)
     return await service.by_category(
         user=current_user,
         account_id=account_id,
@@ -38,21 +43,22 @@ async def by_category(
 
 
 @router.get("/category-detail")
+@cache(expire=DEFAULT_EXPIRE, key_builder=user_scoped_key)
 async def category_detail(
+    request: Request,
     category_id: int | None = None,
     account_id: int | None = None,
     date_from: date | None = None,
     date_to: date | None = None,
     direction: str | None = Query(None, pattern="^(income|expense)$"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: AnalyticsService = Depends(get_analytics_service),
 ):
     """Get transactions for a specific category, grouped by label.
 
     Returns a list of { label, total, count, transactions: [...] }.
     Use category_id=null (or omit it) for uncategorized transactions.
     """
-    service = AnalyticsService(db)
     return await service.category_detail(
         user=current_user,
         category_id=category_id,
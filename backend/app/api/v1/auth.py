@@ -1,9 +1,8 @@
 """Authentication API routes."""
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_auth_service
 from app.schemas.user import AuthResponse, TokenResponse, UserLogin, UserRegister
 from app.services.auth_service import AuthService
 
@@ -11,21 +10,18 @@ router = APIRouter()
 
 
 @router.post("/register", response_model=AuthResponse, status_code=201)
-async def register(data: UserRegister, db: AsyncSession = Depends(get_db)):
+async def register(data: UserRegister, service: AuthService = Depends(get_auth_service)):
     """Register a new user. Returns user info + tokens (auto-login)."""
-    service = AuthService(db)
     return await service.register(data)
 
 
 @router.post("/login", response_model=AuthResponse)
-async def login(data: UserLogin, db: AsyncSession = Depends(get_db)):
+async def login(data: UserLogin, service: AuthService = Depends(get_auth_service)):
     """Login and get user info + tokens."""
-    service = AuthService(db)
     return await service.login(data)
 
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh_token(refresh_token: str, db: AsyncSession = Depends(get_db)):
+async def refresh_token(refresh_token: str, service: AuthService = Depends(get_auth_service)):
     """Refresh access token using a valid refresh token."""
-    service = AuthService(db)
     return await service.refresh(refresh_token)
@@ -1,35 +1,101 @@
 """Category API routes."""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+import time
 
-from app.api.deps import get_current_user, get_db
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.api.deps import get_category_service, get_current_user
+from app.core.cache import cache_delete, cache_get, cache_set, invalidate_user_cache
+from app.core.database import async_session_factory
 from app.models.user import User
 from app.schemas.category import CategoryCreate, CategoryResponse, CategoryUpdate
 from app.services.category_service import CategoryService
+from app.services.embedding_service import invalidate_enriched_categories_cache
 
 router = APIRouter()
 
+# Pre-compiled adapter — avoids FastAPI's per-row response_model validation.
+_CATEGORY_TREE_ADAPTER = TypeAdapter(list[CategoryResponse])
+
+# Stale-while-revalidate: the tree stays in Redis for _TREE_TTL, but once an
+# entry is older than _TREE_SOFT_TTL a hit also schedules a background rebuild.
+# Readers always get an immediate answer and the recursive tree build runs at
+# most once per soft-TTL window per user.
+_TREE_TTL = 600
+_TREE_SOFT_TTL = 300
+
+
+def _tree_key(user_id: int) -> str:
+    return f"cat_tree:{user_id}"
+
+
+async def _store_tree(user_id: int, payload: list) -> None:
+    entry = orjson.dumps((time.time() + _TREE_SOFT_TTL, payload))
+    await cache_set(_tree_key(user_id), entry, expire=_TREE_TTL)
+
 
-@router.get("", response_model=list[CategoryResponse])
+# Singleflight: user ids with a rebuild already scheduled or running. A burst
+# of hits on a stale entry would otherwise schedule one rebuild per hit; with
+# the guard the first hit schedules it and the rest keep serving stale.
+_tree_refreshing: set[int] = set()
+
+
+async def _refresh_category_tree(user_id: int) -> None:
+    """Rebuild one user's cached tree (background task, own session).
+
+    Best-effort: on failure the previous entry keeps serving until _TREE_TTL.
+    """
+    try:
+        async with async_session_factory() as db:
+            user = await db.get(User, user_id)
+            if user is None:
+                return
+            tree = await CategoryService(db).get_category_tree(user)
+        validated = _CATEGORY_TREE_ADAPTER.validate_python(tree)
+        await _store_tree(user_id, _CATEGORY_TREE_ADAPTER.dump_python(validated, mode="json"))
+    except Exception:  # noqa: BLE001 — stale copy is an acceptable fallback
+        pass
+    finally:
+        _tree_refreshing.discard(user_id)
+
+
+@router.get("", response_model=None)
 async def list_categories(
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: CategoryService = Depends(get_category_service),
 ):
     """List all categories (system + user custom) as a tree."""
-    service = CategoryService(db)
-    return await service.get_category_tree(current_user)
+    cached = await cache_get(_tree_key(current_user.id))
+    if cached is not None:
+        refresh_at, payload = orjson.loads(cached)
+        if time.time() >= refresh_at and current_user.id not in _tree_refreshing:
+            _tree_refreshing.add(current_user.id)
+            background_tasks.add_task(_refresh_category_tree, current_user.id)
+        return ORJSONResponse(payload)
+
+    tree = await service.get_category_tree(current_user)
+    validated = _CATEGORY_TREE_ADAPTER.validate_python(tree)
+    payload = _CATEGORY_TREE_ADAPTER.dump_python(validated, mode="json")
+    await _store_tree(current_user.id, payload)
+    return ORJSONResponse(payload)
 
 
 @router.post("", response_model=CategoryResponse, status_code=201)
 async def create_category(
     data: CategoryCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: CategoryService = Depends(get_category_service),
 ):
     """Create a custom user category."""
-    service = CategoryService(db)
-    return await service.create_category(data, current_user)
+    result = await service.create_category(data, current_user)
+    await cache_delete(_tree_key(current_user.id))
+    await invalidate_user_cache(current_user.id)
+    invalidate_enriched_categories_cache(current_user.id)
+    return result
 
 
 @router.patch("/{category_id}", response_model=CategoryResponse)
@@ -37,19 +103,24 @@ async def update_category(
     category_id: int,
     data: CategoryUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: CategoryService = Depends(get_category_service),
 ):
     """Update a user category (cannot modify system categories)."""
-    service = CategoryService(db)
-    return await service.update_category(category_id, data, current_user)
+    result = await service.update_category(category_id, data, current_user)
+    await cache_delete(_tree_key(current_user.id))
+    await invalidate_user_cache(current_user.id)
+    invalidate_enriched_categories_cache(current_user.id)
+    return result
 
 
 @router.delete("/{category_id}", status_code=204)
 async def delete_category(
     category_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: CategoryService = Depends(get_category_service),
 ):
     """Delete a user category (cannot delete system categories)."""
-    service = CategoryService(db)
     await service.delete_category(category_id, current_user)
+    await cache_delete(_tree_key(current_user.id))
+    await invalidate_user_cache(current_user.id)
+    invalidate_enriched_categories_cache(current_user.id)
@@ -3,11 +3,17 @@
 One proposal per account. GET to fetch, POST recalculate to refresh, PATCH to update cluster states.
 """
 
+import time
+import uuid
+
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_classification_service, get_current_user
+from app.core.cache import CACHE_PREFIX, cache_get, cache_set, invalidate_user_cache
+from app.core.database import async_session_factory
 from app.models.user import User
 from app.schemas.classification import (
     ClassificationProposalResponse,
@@ -30,10 +36,9 @@ router = APIRouter()
 async def get_classification(
     account_id: int = Query(..., description="Account ID"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ClassificationService = Depends(get_classification_service),
 ):
     """Get the classification proposal for an account. Returns None if no proposal exists."""
-    service = ClassificationService(db)
     return await service.get_proposal(current_user, account_id)
 
 
@@ -41,10 +46,9 @@ async def get_classification(
 async def recalculate_classification(
     data: RecalculateRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ClassificationService = Depends(get_classification_service),
 ):
     """Recalculate classification: parse labels, compute embeddings, cluster. Replaces existing proposal."""
-    service = ClassificationService(db)
     return await service.recalculate(
         current_user,
         data.account_id,
@@ -56,18 +60,16 @@ async def recalculate_classification(
 async def patch_classification(
     data: ClassificationPatchRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ClassificationService = Depends(get_classification_service),
 ):
     """Update cluster states (status, overrides, exclusions)."""
     if not data.cluster_updates:
-        service = ClassificationService(db)
         return await service.get_proposal(current_user, data.account_id)
 
-    service = ClassificationService(db)
     return await service.patch_proposal(
         current_user,
         data.account_id,
-        [u.model_dump(exclude_unset=True) for u in data.cluster_updates],
+        data.cluster_updates,
     )
 
 
@@ -76,11 +78,10 @@ async def apply_cluster(
     cluster_id: int,
     data: ApplyClusterRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ClassificationService = Depends(get_classification_service),
 ):
     """Apply category to a cluster's transactions. Marks cluster as accepted."""
-    service = ClassificationService(db)
-    return await service.apply_cluster(
+    result = await service.apply_cluster(
         current_user,
         cluster_id,
         data.transaction_ids,
@@ -89,6 +90,9 @@ async def apply_cluster(
         data.rule_pattern,
         data.custom_label,
     )
+    # Categorizing transactions changes every cached analytics aggregate.
+    await invalidate_user_cache(current_user.id)
+    return result
 
 
 @router.post("/clusters/{cluster_id}/recluster", response_model=ReclusterResponse)
@@ -96,10 +100,9 @@ async def recluster_cluster(
     cluster_id: int,
     data: ReclusterRequest = ReclusterRequest(),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: ClassificationService = Depends(get_classification_service),
 ):
     """Recluster a heterogeneous cluster. Uses LLM when available, else embeddings."""
-    service = ClassificationService(db)
     proposal_dict, debug_info = await service.recluster(
         current_user, cluster_id, data.distance_threshold, data.use_llm
     )
@@ -107,3 +110,96 @@ async def recluster_cluster(
         proposal=proposal_dict,
         debug=ReclusterDebug(**debug_info),
     )
+
+
+# ── Async recluster (202 + polling) ────────────────────────
+# Reclustering can take seconds when the LLM is involved; the async variant
+# returns immediately and runs the work after the response. Job states live in
+# a small in-process store mirrored to Redis (best-effort), so polling also
+# works across workers when Redis is up.
+
+_JOB_TTL = 600  # seconds
+_JOB_STORE_MAX = 1_000
+_recluster_jobs: dict[str, tuple[float, dict]] = {}
+
+
+def _job_key(task_id: str) -> str:
+    return f"{CACHE_PREFIX}:recluster-job:{task_id}"
+
+
+async def _publish_job(task_id: str, payload: dict) -> None:
+    if len(_recluster_jobs) >= _JOB_STORE_MAX:
+        now = time.time()
+        for key in [k for k, (exp, _) in _recluster_jobs.items() if exp <= now]:
+            _recluster_jobs.pop(key, None)
+    _recluster_jobs[task_id] = (time.time() + _JOB_TTL, payload)
+    await cache_set(_job_key(task_id), orjson.dumps(jsonable_encoder(payload)), expire=_JOB_TTL)
+
+
+async def _run_recluster_job(
+    task_id: str,
+    user_id: int,
+    cluster_id: int,
+    distance_threshold: float | None,
+    use_llm: bool,
+) -> None:
+    """Background worker: own session, result published under the task id."""
+    try:
+        async with async_session_factory() as db:
+            user = await db.get(User, user_id)
+            service = ClassificationService(db)
+            proposal_dict, debug_info = await service.recluster(
+                user, cluster_id, distance_threshold, use_llm
+            )
+            await db.commit()
+        payload = {
+            "user_id": user_id,
+            "status": "done",
+            "result": {"proposal": proposal_dict, "debug": debug_info},
+        }
+    except Exception as e:
+        logger.exception("recluster_job_failed", task_id=task_id, cluster_id=cluster_id)
+        payload = {"user_id": user_id, "status": "error", "error": str(e)}
+    await _publish_job(task_id, payload)
+
+
+@router.post("/clusters/{cluster_id}/recluster-async", status_code=202)
+async def recluster_cluster_async(
+    cluster_id: int,
+    background_tasks: BackgroundTasks,
+    data: ReclusterRequest = ReclusterRequest(),
+    current_user: User = Depends(get_current_user),
+):
+    """Start a recluster in the background. Poll GET /recluster-jobs/{task_id} for the result."""
+    task_id = uuid.uuid4().hex
+    await _publish_job(task_id, {"user_id": current_user.id, "status": "pending"})
+    background_tasks.add_task(
+        _run_recluster_job,
+        task_id,
+        current_user.id,
+        cluster_id,
+        data.distance_threshold,
+        data.use_llm,
+    )
+    return {"task_id": task_id, "status": "pending"}
+
+
+@router.get("/recluster-jobs/{task_id}")
+async def get_recluster_job(
+    task_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """Poll an async recluster job: pending, done (with ReclusterResponse payload) or error."""
+    entry = _recluster_jobs.get(task_id)
+    if entry is not None and entry[0] > time.time():
+        payload = entry[1]
+    else:
+        raw = await cache_get(_job_key(task_id))
+        if raw is None:
+            raise HTTPException(status_code=404, detail="Tâche inconnue ou expirée.")
+        payload = orjson.loads(raw)
+
+    if payload.get("user_id") != current_user.id:
+        raise HTTPException(status_code=404, detail="Tâche inconnue ou expirée.")
+
+    return {k: v for k, v in payload.items() if k != "user_id"}
@@ -1,9 +1,9 @@
 """Classification rules API routes."""
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_rule_service
+from app.core.cache import invalidate_user_cache
 from app.models.user import User
 from app.schemas.classification_rule import (
     ApplyRulesResult,
@@ -19,10 +19,9 @@ router = APIRouter()
 @router.get("", response_model=list[RuleResponse])
 async def list_rules(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: RuleService = Depends(get_rule_service),
 ):
     """List all classification rules for the current user."""
-    service = RuleService(db)
     return await service.list_rules(current_user)
 
 
@@ -30,10 +29,9 @@ async def list_rules(
 async def create_rule(
     data: RuleCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: RuleService = Depends(get_rule_service),
 ):
     """Create a new classification rule."""
-    service = RuleService(db)
     return await service.create_rule(data, current_user)
 
 
@@ -42,10 +40,9 @@ async def update_rule(
     rule_id: int,
     data: RuleUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: RuleService = Depends(get_rule_service),
 ):
     """Update an existing classification rule."""
-    service = RuleService(db)
     return await service.update_rule(rule_id, data, current_user)
 
 
@@ -53,10 +50,9 @@ async def update_rule(
 async def delete_rule(
     rule_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: RuleService = Depends(get_rule_service),
 ):
     """Delete a classification rule."""
-    service = RuleService(db)
     await service.delete_rule(rule_id, current_user)
 
 
@@ -64,8 +60,10 @@ async def delete_rule(
 async def apply_rules(
     account_id: int | None = None,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: RuleService = Depends(get_rule_service),
 ):
     """Apply all active rules to uncategorized transactions."""
-    service = RuleService(db)
-    return await service.apply_rules(current_user, account_id)
+    result = await service.apply_rules(current_user, account_id)
+    # Rule application categorizes transactions — cached analytics are stale.
+    await invalidate_user_cache(current_user.id)
+    return result
@@ -1,21 +1,48 @@
 """Transaction API routes."""
 
+import asyncio
+import hashlib
+import tempfile
+import zipfile
 from datetime import date
 from decimal import Decimal
+from typing import Literal
 
+import orjson
 import structlog
-from fastapi import APIRouter, Depends, File, Query, UploadFile
-from sqlalchemy import select
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import (
+    get_current_user,
+    get_db,
+    get_embedding_service,
+    get_import_service,
+    get_transaction_service,
+    get_user_account_ids,
+)
+from app.core.cache import CACHE_PREFIX, cache_get, cache_set, invalidate_user_cache, make_etag
 from app.core.exceptions import ValidationError
+from app.models.account import Account
 from app.models.transaction import Transaction
 from app.models.user import User
 from app.config import settings
 from app.schemas.transaction import (
     ClusterClassifyRequest,
     ClusterClassifyResult,
+    ClusterSampleTransaction,
     ClustersResponse,
     ComputeEmbeddingsResult,
     FileBalanceInfo,
@@ -39,8 +66,16 @@ logger = structlog.get_logger()
 
 router = APIRouter()
 
+# Pre-compiled adapter: one validate+dump pass over the whole page instead of
+# FastAPI's per-request, field-by-field response_model validation (same
+# pattern as the accounts list).
+_PAGE_ADAPTER = TypeAdapter(PaginatedResponse)
+# Bulk Pydantic→dict dump for interpret_cluster (one Rust pass, no per-row
+# dict comprehension).
+_CLUSTER_TXNS_ADAPTER = TypeAdapter(list[ClusterSampleTransaction])
+
 
-@router.get("", response_model=PaginatedResponse)
+@router.get("", response_model=None)
 async def list_transactions(
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=200),
@@ -50,15 +85,27 @@ async def list_transactions(
     category_id: int | None = None,
     amount_min: Decimal | None = None,
     amount_max: Decimal | None = None,
+    amount_min_cents: int | None = Query(None, description="Integer-cents alternative to amount_min"),
+    amount_max_cents: int | None = Query(None, description="Integer-cents alternative to amount_max"),
     search: str | None = None,
-    sort_by: str = "date",
-    sort_order: str = "desc",
+    sort_by: Literal["date", "amount", "label_raw", "category_id", "created_at"] = "date",
+    sort_order: Literal["asc", "desc"] = "desc",
+    cursor: str | None = Query(None, description="Keyset cursor from meta.next_cursor (date sort only)"),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: TransactionService = Depends(get_transaction_service),
 ):
-    """List transactions with pagination and filters."""
-    service = TransactionService(db)
-    return await service.list_transactions(
+    """List transactions with pagination and filters.
+
+    Pass meta.next_cursor back as cursor to paginate without OFFSET cost on
+    deep pages; page/per_page still works for shallow pages and other sorts.
+    Amount bounds accept integer cents (*_cents) validated as plain ints —
+    cheaper than Decimal coercion — and converted exactly once here.
+    """
+    if amount_min_cents is not None:
+        amount_min = Decimal(amount_min_cents).scaleb(-2)
+    if amount_max_cents is not None:
+        amount_max = Decimal(amount_max_cents).scaleb(-2)
+    result = await service.list_transactions(
         user=current_user,
         page=page,
         per_page=per_page,
@@ -71,24 +118,47 @@ async def list_transactions(
         search=search,
         sort_by=sort_by,
         sort_order=sort_order,
+        cursor=cursor,
     )
+    page_out = _PAGE_ADAPTER.validate_python(result)
+    return ORJSONResponse(_PAGE_ADAPTER.dump_python(page_out, mode="json"))
 
 
 @router.post("", response_model=TransactionResponse, status_code=201)
 async def create_transaction(
     data: TransactionCreate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: TransactionService = Depends(get_transaction_service),
 ):
     """Create a transaction manually."""
-    service = TransactionService(db)
-    return await service.create_transaction(data, current_user)
+    result = await service.create_transaction(data, current_user)
+    await invalidate_user_cache(current_user.id)
+    return result
+
 
+async def _cashflow_version(db: AsyncSession, user_id: int, account_id: int | None) -> tuple:
+    """Cheap version token for cashflow: latest write + row count.
 
-@router.get("/cashflow")
+    Any insert, update or soft-delete changes at least one component, so a
+    matching ETag guarantees the client's aggregates are still current.
+    """
+    clauses = [
+        Transaction.account_id.in_(select(Account.id).where(Account.user_id == user_id)),
+        Transaction.deleted_at.is_(None),
+    ]
+    if account_id:
+        clauses.append(Transaction.account_id == account_id)
+    row = await db.execute(
+        select(func.max(Transaction.updated_at), func.count(Transaction.id)).where(*clauses)
+    )
+    return row.one()
+
+
+@router.get("/cashflow", response_model=None)
 async def get_cashflow(
+    request: Request,
     account_id: int | None = None,
-    granularity: str = Query("monthly", pattern="^(monthly|daily)$"),
+    granularity: Literal["monthly", "daily"] = "monthly",
     date_from: date | None = None,
     date_to: date | None = None,
     category_id: int | None = None,
@@ -96,11 +166,31 @@ async def get_cashflow(
     amount_max: Decimal | None = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    service: TransactionService = Depends(get_transaction_service),
 ):
     """Get cashflow aggregates (monthly bars or daily cumulative line).
-    Supports same filters as list_transactions for consistency."""
-    service = TransactionService(db)
-    return await service.get_cashflow(
+    Supports same filters as list_transactions for consistency.
+
+    Dashboards poll this endpoint, so responses carry an ETag derived from the
+    latest transaction write: unchanged data short-circuits to a 304, and each
+    (filters, version) payload is kept in Redis so a hit skips SQL entirely.
+    """
+    version = await _cashflow_version(db, current_user.id, account_id)
+    query = str(sorted(request.query_params.multi_items()))
+    query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()[:16]
+    etag = make_etag(current_user.id, "cashflow", query_hash, *version)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    # Version-keyed entry (in the user namespace): a write changes the key,
+    # so a stale payload can never be served — the old entry just expires.
+    version_token = etag.strip('"')
+    key = f"{CACHE_PREFIX}:user:{current_user.id}:cashflow:{query_hash}:{version_token}"
+    cached = await cache_get(key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json", headers={"ETag": etag})
+
+    data = await service.get_cashflow(
         current_user,
         account_id=account_id,
         granularity=granularity,
@@ -110,6 +200,9 @@ async def get_cashflow(
         amount_min=amount_min,
         amount_max=amount_max,
     )
+    payload = orjson.dumps(data)
+    await cache_set(key, payload, expire=3600)
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/balance-at-date")
@@ -117,13 +210,15 @@ async def get_balance_at_date(
     date_at: date = Query(..., alias="date", description="Date to compute balance at (inclusive)"),
     account_id: int | None = None,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: TransactionService = Depends(get_transaction_service),
 ):
     """Get total balance at a specific date (initial_balance + sum of transactions up to date).
     When account_id is set, returns balance for that account only. Otherwise sums all user accounts."""
-    service = TransactionService(db)
     balance = await service.get_balance_at_date(current_user, date_at, account_id)
-    return {"date": date_at.isoformat(), "balance": float(balance)}
+    # Return the response directly: skips FastAPI's jsonable_encoder pass and
+    # lets orjson serialize the date natively. Two-decimal Numeric amounts
+    # round-trip through float unchanged (orjson emits the shortest repr).
+    return ORJSONResponse({"date": date_at, "balance": float(balance)})
 
 
 # ── Embedding-based classification endpoints ─────────────
@@ -135,6 +230,7 @@ async def parse_labels(
     force: bool = False,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    account_ids: list[int] = Depends(get_user_account_ids),
 ):
     """Parse raw labels to extract structured metadata (counterparty, card, etc.).
 
@@ -144,12 +240,14 @@ async def parse_labels(
     Parsed transactions will have their embeddings reset so they are recomputed
     using the cleaned counterparty text on the next embedding computation.
     """
-    from app.models.account import Account
-    from app.services.label_parser import parse_label
-
-    user_accounts = select(Account.id).where(Account.user_id == current_user.id)
-    query = select(Transaction).where(
-        Transaction.account_id.in_(user_accounts),
+    from app.services.label_parser import parse_labels_parallel
+
+    query = select(
+        Transaction.id, Transaction.label_raw, Transaction.parsed_metadata
+    ).where(
+        # Plain parameterized IN-list — the ownership subquery is prefetched
+        # once per request by the dependency.
+        Transaction.account_id.in_(account_ids),
         Transaction.deleted_at.is_(None),
     )
     if account_id:
@@ -157,42 +255,75 @@ async def parse_labels(
     if not force:
         query = query.where(Transaction.parsed_metadata.is_(None))
 
-    result = await db.execute(query)
-    transactions = list(result.scalars().all())
-
+    # Stream column rows in partitions of 1000 (server-side cursor) and write
+    # each batch before fetching the next: memory stays constant whatever the
+    # transaction count, and the regex work overlaps the DB fetches. The old
+    # per-instance mutation made the flush emit one UPDATE per transaction.
     parsed_count = 0
-    for txn in transactions:
-        metadata = parse_label(txn.label_raw)
-        txn.parsed_metadata = metadata
-        # Reset embedding so it gets recomputed with cleaned counterparty text
-        txn.embedding = None
-        parsed_count += 1
+    # 4000-row partitions: big enough that a full partition fans out across
+    # the parser's process pool, small enough to keep memory flat.
+    stream = await db.stream(query.execution_options(yield_per=4000))
+    async for partition in stream.partitions(4000):
+        # Pure-CPU regex work — off the event loop, across cores when the
+        # partition is large (see parse_labels_parallel).
+        metadatas = await parse_labels_parallel(
+            [label_raw for _, label_raw, _ in partition]
+        )
+        # ORM bulk UPDATE by primary key: update(Transaction) with no WHERE
+        # plus param dicts keyed on "id" is the one executemany form the
+        # AsyncSession supports (an explicit WHERE on bindparams raises
+        # InvalidRequestError).
+        await db.execute(
+            update(Transaction),
+            [
+                {"id": txn_id, "parsed_metadata": pm}
+                for (txn_id, _, _), pm in zip(partition, metadatas)
+            ],
+        )
 
-    await db.flush()
+        # Reset embeddings only where the embedding input (the counterparty,
+        # or the raw label as fallback) actually changed — on force=true
+        # re-parses most rows produce the same counterparty, and rewriting an
+        # unchanged or already-NULL vector is pure WAL volume.
+        reset_ids = [
+            txn_id
+            for (txn_id, _, old_pm), pm in zip(partition, metadatas)
+            if (old_pm or {}).get("counterparty") != pm.get("counterparty")
+        ]
+        if reset_ids:
+            await db.execute(
+                update(Transaction)
+                .where(
+                    Transaction.id.in_(reset_ids),
+                    Transaction.embedding.is_not(None),
+                )
+                .values(embedding=None)
+                .execution_options(synchronize_session=False)
+            )
+        parsed_count += len(partition)
 
     logger.info(
         "labels_parsed",
         user_id=current_user.id,
         parsed=parsed_count,
-        total=len(transactions),
+        total=parsed_count,
         force=force,
     )
 
-    return {"parsed": parsed_count, "total": len(transactions)}
+    return {"parsed": parsed_count, "total": parsed_count}
 
 
 @router.post("/compute-embeddings", response_model=ComputeEmbeddingsResult)
 async def compute_embeddings(
     account_id: int | None = None,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: EmbeddingService = Depends(get_embedding_service),
 ):
     """Compute embeddings for transactions that don't have one yet.
 
     This is a prerequisite for clustering and similarity-based suggestions.
     Embeddings are computed locally using sentence-transformers (no GPU needed).
     """
-    service = EmbeddingService(db)
     return await service.compute_missing_embeddings(current_user, account_id)
 
 
@@ -207,7 +338,7 @@ async def get_clusters(
         description="Cosine distance threshold: lower = more selective (tighter clusters), higher = more grouping.",
     ),
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: EmbeddingService = Depends(get_embedding_service),
 ):
     """Get clusters of similar uncategorized transactions with category suggestions.
 
@@ -216,7 +347,6 @@ async def get_clusters(
 
     Each cluster proposes a category via k-NN on classified transactions or category semantics.
     """
-    service = EmbeddingService(db)
     return await service.get_clusters(
         current_user, account_id, min_cluster_size, distance_threshold
     )
@@ -226,7 +356,7 @@ async def get_clusters(
 async def classify_cluster(
     data: ClusterClassifyRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: EmbeddingService = Depends(get_embedding_service),
 ):
     """Classify a cluster (or arbitrary set) of transactions.
 
@@ -234,8 +364,7 @@ async def classify_cluster(
     Optionally creates a classification rule for future transactions.
     The user always controls what gets classified — nothing is automatic.
     """
-    service = EmbeddingService(db)
-    return await service.classify_transactions(
+    result = await service.classify_transactions(
         transaction_ids=data.transaction_ids,
         category_id=data.category_id,
         user=current_user,
@@ -243,21 +372,27 @@ async def classify_cluster(
         create_rule=data.create_rule,
         rule_pattern=data.rule_pattern,
     )
+    await invalidate_user_cache(current_user.id)
+    return result
+
+
+# Constant for the process lifetime — settings are read once at startup
+_LLM_STATUS = LlmStatusResponse(ui_enabled=settings.llm_ui_enabled)
 
 
 @router.get("/clusters/llm-status", response_model=LlmStatusResponse)
-async def get_llm_status(
+def get_llm_status(
     current_user: User = Depends(get_current_user),
 ):
     """Return whether the LLM (Ollama) UI is enabled. When false, frontend hides the « Interpréter (LLM) » button."""
-    return LlmStatusResponse(ui_enabled=settings.llm_ui_enabled)
+    return _LLM_STATUS
 
 
 @router.post("/clusters/interpret", response_model=InterpretClusterResult)
 async def interpret_cluster(
     data: InterpretClusterRequest,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    embedding_service: EmbeddingService = Depends(get_embedding_service),
 ):
     """Invoke the local LLM to interpret a cluster and suggest a category.
 
@@ -266,13 +401,9 @@ async def interpret_cluster(
     """
     from app.services.llm_service import LLMService
 
-    embedding_service = EmbeddingService(db)
     enriched_cats = await embedding_service._get_enriched_categories(current_user)
 
-    transactions_with_id = [
-        {"id": t.id, "label_raw": t.label_raw, "amount": t.amount, "date": t.date}
-        for t in data.transactions
-    ]
+    transactions_with_id = _CLUSTER_TXNS_ADAPTER.dump_python(data.transactions)
 
     llm_service = LLMService()
     available = await llm_service.is_available()
@@ -323,10 +454,9 @@ async def interpret_cluster(
 async def get_transaction(
     transaction_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: TransactionService = Depends(get_transaction_service),
 ):
     """Get a specific transaction."""
-    service = TransactionService(db)
     return await service.get_transaction(transaction_id, current_user)
 
 
@@ -335,41 +465,70 @@ async def update_transaction(
     transaction_id: int,
     data: TransactionUpdate,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: TransactionService = Depends(get_transaction_service),
 ):
     """Update a transaction (category, notes, tags)."""
-    service = TransactionService(db)
-    return await service.update_transaction(transaction_id, data, current_user)
+    result = await service.update_transaction(transaction_id, data, current_user)
+    await invalidate_user_cache(current_user.id)
+    return result
 
 
 @router.delete("/{transaction_id}", status_code=204)
 async def delete_transaction(
     transaction_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    service: TransactionService = Depends(get_transaction_service),
 ):
     """Soft delete a transaction."""
-    service = TransactionService(db)
     await service.delete_transaction(transaction_id, current_user)
+    await invalidate_user_cache(current_user.id)
 
 
 # ── Import ──────────────────────────────────────────────
 
 
+async def _spool_upload(file: UploadFile) -> tempfile.SpooledTemporaryFile:
+    """Copy an upload into a SpooledTemporaryFile in 64 KiB chunks.
+
+    Keeps memory flat for multi-MB files: small uploads stay in RAM, larger
+    ones spill to disk, and the parsers accept the file object directly.
+    """
+    tmp = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+    while chunk := await file.read(64 * 1024):
+        tmp.write(chunk)
+    tmp.seek(0)
+    return tmp
+
+
 @router.post("/import/preview", response_model=ImportPreviewResult)
 async def import_preview(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
 ):
     """Preview file before import. For OFX, returns bank account info from file."""
-    from app.utils.file_parsers import extract_ofx_account_info, parse_csv, parse_excel, parse_ofx
+    from app.utils.file_parsers import (
+        count_rows_csv,
+        count_rows_excel,
+        count_rows_ofx,
+        extract_ofx_account_info,
+        sniff_format,
+    )
 
-    content = await file.read()
+    # Spool instead of buffering the whole upload; the parsers rewind the
+    # stream themselves between passes. Counting only — the full parse with
+    # per-row objects happens at import time, not here.
+    content = await _spool_upload(file)
     filename = file.filename or "upload"
     ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
 
+    # Magic-byte sniff first: a mislabeled file fails here in microseconds
+    # instead of after a full parse attempt.
+    sniffed = sniff_format(content)
+
     if ext in ("ofx", "qfx", "xml"):
-        file_account_info = extract_ofx_account_info(content)
+        if sniffed != "ofx":
+            raise ValidationError("Le contenu du fichier ne ressemble pas à un fichier OFX/QFX.")
+        file_account_info = await asyncio.to_thread(extract_ofx_account_info, content)
         file_balance_info = None
         if file_account_info and "balance_date" in file_account_info:
             file_balance_info = FileBalanceInfo(
@@ -377,34 +536,96 @@ async def import_preview(
                 amount=file_account_info["balance_amount"],
                 source=file_account_info.get("balance_source", "ledger"),
             )
-        try:
-            txns = parse_ofx(content)
-        except Exception:
-            txns = []
         return ImportPreviewResult(
             format="ofx",
-            total_rows=len(txns),
+            # Pure byte scan, no parse to fail
+            total_rows=await asyncio.to_thread(count_rows_ofx, content),
             file_account_info=file_account_info,
             file_balance_info=file_balance_info,
         )
     if ext in ("csv",):
+        if sniffed != "csv":
+            raise ValidationError("Le contenu du fichier ne ressemble pas à un fichier CSV.")
         try:
-            txns = parse_csv(content)
-        except Exception:
-            txns = []
-        return ImportPreviewResult(format="csv", total_rows=len(txns), file_account_info=None)
+            total_rows = await asyncio.to_thread(count_rows_csv, content)
+        except ValueError as e:
+            # Undecodable content — message from _decode is already user-facing
+            raise ValidationError(str(e)) from e
+        return ImportPreviewResult(format="csv", total_rows=total_rows, file_account_info=None)
     if ext in ("xlsx", "xls"):
+        if sniffed != "excel":
+            raise ValidationError("Le contenu du fichier ne ressemble pas à un fichier Excel.")
         try:
-            txns = parse_excel(content)
-        except Exception:
-            txns = []
-        return ImportPreviewResult(format="excel", total_rows=len(txns), file_account_info=None)
+            total_rows = await asyncio.to_thread(count_rows_excel, content)
+        except (zipfile.BadZipFile, ValueError) as e:
+            raise ValidationError(f"Fichier Excel illisible : {e}") from e
+        return ImportPreviewResult(format="excel", total_rows=total_rows, file_account_info=None)
 
     return ImportPreviewResult(format=ext or "unknown", total_rows=0, file_account_info=None)
 
 
+async def _run_post_import_passes(
+    user_id: int, account_id: int, new_ids: list[int]
+) -> None:
+    """Apply rules and compute embeddings for freshly imported rows.
+
+    Scheduled via BackgroundTasks, after the /import response is sent. Rules
+    are DB-bound, embeddings are model-bound — independent work on the same
+    new rows, so they run concurrently on their own sessions (one session must
+    never be used from two tasks). Both passes are best-effort: a failure is
+    logged, never surfaced.
+    """
+    from app.core.database import async_session_factory
+    from app.services.rule_service import RuleService
+
+    async def run_rules() -> dict:
+        async with async_session_factory() as session:
+            user = await session.get(User, user_id)
+            rule_result = await RuleService(session).apply_rules(
+                user, account_id, only_ids=new_ids
+            )
+            await session.commit()
+            return rule_result
+
+    async def run_embeddings() -> dict:
+        async with async_session_factory() as session:
+            user = await session.get(User, user_id)
+            emb_result = await EmbeddingService(session).compute_missing_embeddings(
+                user, account_id, only_ids=new_ids
+            )
+            await session.commit()
+            return emb_result
+
+    rule_result, emb_result = await asyncio.gather(
+        run_rules(), run_embeddings(), return_exceptions=True
+    )
+
+    if isinstance(rule_result, BaseException):
+        logger.warning("auto_rules_failed", error=str(rule_result))
+    else:
+        logger.info(
+            "auto_rules_after_import",
+            imported=len(new_ids),
+            rules_applied=rule_result["applied"],
+        )
+
+    if isinstance(emb_result, BaseException):
+        logger.warning("auto_embeddings_failed", error=str(emb_result))
+    else:
+        logger.info(
+            "auto_embeddings_after_import",
+            imported=len(new_ids),
+            embeddings_computed=emb_result["computed"],
+        )
+
+    # The passes categorize rows after the import already invalidated —
+    # refresh the cached aggregates once more.
+    await invalidate_user_cache(user_id)
+
+
 @router.post("/import", response_model=ImportResult)
 async def import_transactions(
+    background_tasks: BackgroundTasks,
     account_id: int = Query(..., description="Target account (used for use/update)"),
     account_action: str = Query("use", description="use | update | create"),
     new_account_name: str | None = Query(None, description="For create: name of new account"),
@@ -412,6 +633,7 @@ async def import_transactions(
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    service: ImportService = Depends(get_import_service),
 ):
     """Import transactions from a file (CSV, Excel, OFX/QFX/XML).
 
@@ -424,17 +646,26 @@ async def import_transactions(
     1. Applies user classification rules (fast, deterministic)
     2. Computes embeddings for new transactions (local, no API call)
     """
-    content = await file.read()
+    # Stream the upload to a spooled temp file (spills to disk past 1 MiB)
+    # instead of buffering the whole payload as one bytes object.
+    content = await _spool_upload(file)
     filename = file.filename or "upload"
 
     from app.utils.file_parsers import extract_ofx_account_info
     from app.services.account_service import AccountService
     from app.schemas.account import AccountCreate, AccountUpdate
 
+    # Extract OFX metadata at most once per request — the create/update and
+    # balance-reference branches all used to rescan the whole file for it.
+    file_info = None
+    if account_action in ("create", "update") or apply_balance_reference:
+        ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+        if ext in ("ofx", "qfx", "xml"):
+            file_info = await asyncio.to_thread(extract_ofx_account_info, content)
+
     target_account_id = account_id
 
     if account_action == "create" and new_account_name:
-        file_info = extract_ofx_account_info(content)
         if file_info:
             acc_service = AccountService(db)
             bank_label = (
@@ -457,7 +688,6 @@ async def import_transactions(
         else:
             raise ValidationError("Création de compte : informations bancaires non trouvées dans le fichier OFX.")
     elif account_action == "update":
-        file_info = extract_ofx_account_info(content)
         if file_info:
             acc_service = AccountService(db)
             bank_label = (
@@ -475,17 +705,18 @@ async def import_transactions(
                 current_user,
             )
 
-    service = ImportService(db)
     result = await service.import_file(
         user=current_user,
         account_id=target_account_id,
         filename=filename,
         content=content,
     )
+    # Ids of the rows this import created — the post-import passes below
+    # operate on exactly this set instead of rescanning the whole account.
+    new_ids = result.pop("new_ids", [])
 
     # Apply balance reference from OFX (LEDGERBAL/AVAILBAL) if requested
     if apply_balance_reference:
-        file_info = extract_ofx_account_info(content)
         if file_info and "balance_date" in file_info and "balance_amount" in file_info:
             acc_service = AccountService(db)
             ref_date = date.fromisoformat(file_info["balance_date"])
@@ -503,37 +734,16 @@ async def import_transactions(
                 ref_amount=str(ref_amount),
             )
 
-    # Auto-classify with rules (fast, no API call)
-    if result["imported_count"] > 0:
-        try:
-            from app.services.rule_service import RuleService
-            rule_service = RuleService(db)
-            rule_result = await rule_service.apply_rules(current_user, target_account_id)
-            result["rules_applied"] = rule_result["applied"]
-            logger.info(
-                "auto_rules_after_import",
-                imported=result["imported_count"],
-                rules_applied=rule_result["applied"],
-            )
-        except Exception as e:
-            logger.warning("auto_rules_failed", error=str(e))
-            result["rules_applied"] = 0
-
-    # Compute embeddings for new transactions (local, best-effort)
+    # Post-import passes run after the response is sent (BackgroundTasks):
+    # the client no longer waits on rules SQL + CPU-bound encodes for large
+    # files. Commit first so the task's sessions see the new rows. The
+    # rules_applied / embeddings_computed response fields are optional and
+    # stay unset; the passes log their outcome instead.
     if result["imported_count"] > 0:
-        try:
-            embedding_service = EmbeddingService(db)
-            emb_result = await embedding_service.compute_missing_embeddings(
-                current_user, target_account_id
-            )
-            result["embeddings_computed"] = emb_result["computed"]
-            logger.info(
-                "auto_embeddings_after_import",
-                imported=result["imported_count"],
-                embeddings_computed=emb_result["computed"],
-            )
-        except Exception as e:
-            logger.warning("auto_embeddings_failed", error=str(e))
-            result["embeddings_computed"] = 0
+        await db.commit()
+        background_tasks.add_task(
+            _run_post_import_passes, current_user.id, target_account_id, new_ids
+        )
 
+    await invalidate_user_cache(current_user.id)
     return result
@@ -16,17 +16,19 @@ async def get_profile(current_user: User = Depends(get_current_user)):
 
 
 @router.patch("/me", response_model=UserResponse)
-async def update_profile(
+def update_profile(
     data: UserUpdate,
     current_user: User = Depends(get_current_user),
 ):
     """Update current user profile."""
+    # Plain def: no awaits here, so Starlette runs it in the threadpool
+    # instead of blocking the event loop.
     # TODO: implement update logic
     raise NotImplementedError
 
 
 @router.delete("/me", status_code=204)
-async def delete_account(current_user: User = Depends(get_current_user)):
+def delete_account(current_user: User = Depends(get_current_user)):
     """Soft delete current user account."""
     # TODO: implement soft delete
     raise NotImplementedError
@@ -1,5 +1,7 @@
 """Application configuration using pydantic-settings."""
 
+from functools import cached_property
+
 from pydantic_settings import BaseSettings
 
 
@@ -42,6 +44,9 @@ class Settings(BaseSettings):
 
     # Embeddings (local classification)
     embedding_model_name: str = "paraphrase-multilingual-MiniLM-L12-v2"
+    # "torch" (sentence-transformers) ou "onnx-int8" (ONNX Runtime quantifié,
+    # nécessite optimum[onnxruntime] ; retombe sur torch si indisponible)
+    embedding_backend: str = "torch"
     embedding_dimensions: int = 384
     embedding_similarity_high: float = 0.85
     embedding_similarity_medium: float = 0.70
@@ -62,6 +67,7 @@ class Settings(BaseSettings):
     llm_base_url: str = "http://localhost:11434"
     llm_model: str = "mistral"
     llm_timeout: float = 60.0  # seconds per request
+    llm_concurrency: int = 2  # appels Ollama simultanés max (les autres attendent côté Python)
 
     # CORS
     cors_origins: str = "http://localhost:3000,http://localhost:5173"
@@ -69,8 +75,9 @@ class Settings(BaseSettings):
     # Upload
     max_upload_size_mb: int = 10
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
+        # Derived once per Settings instance, not re-split on every access.
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
     model_config = {
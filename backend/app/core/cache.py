@@ -0,0 +1,91 @@
+"""Response caching helpers — Redis-backed, user-scoped (fastapi-cache2).
+
+Analytics GETs recompute category aggregates on every request even though the
+underlying data barely changes within a session. We cache the serialized
+payload per user in Redis and invalidate the whole user namespace whenever
+transactions or categories mutate.
+
+Keys are built as ``{prefix}:user:{user_id}:{path}:{query_hash}`` so that
+``invalidate_user_cache(user_id)`` can clear exactly one user's entries —
+never cache these payloads globally, they contain personal financial data.
+"""
+
+import hashlib
+
+import structlog
+from fastapi_cache import FastAPICache
+
+logger = structlog.get_logger()
+
+CACHE_PREFIX = "mf-cache"
+DEFAULT_EXPIRE = 300  # seconds
+
+
+def user_scoped_key(
+    func,
+    namespace: str = "",
+    *,
+    request=None,
+    response=None,
+    args=(),
+    kwargs=None,
+) -> str:
+    """Key builder scoping cache entries to the authenticated user.
+
+    Hashes the route path and all query params (account_id, date_from, …) so
+    each filter combination gets its own entry.
+    """
+    kwargs = kwargs or {}
+    user = kwargs.get("current_user")
+    user_id = user.id if user is not None else "anon"
+    path = request.url.path if request is not None else func.__name__
+    query = str(sorted(request.query_params.multi_items())) if request is not None else ""
+    query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()[:16]
+    return f"{CACHE_PREFIX}:user:{user_id}:{path}:{query_hash}"
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag from cheap version components (max timestamps, counts).
+
+    Any change in the underlying rows changes at least one component, so a
+    matching If-None-Match header means the cached client payload is current.
+    """
+    raw = "|".join(str(p) for p in parts)
+    return '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16] + '"'
+
+
+async def cache_get(key: str) -> bytes | None:
+    """Best-effort raw GET against the cache backend (None when unavailable)."""
+    try:
+        return await FastAPICache.get_backend().get(key)
+    except Exception:  # cache not initialized (tests) or Redis down
+        return None
+
+
+async def cache_set(key: str, value: bytes, expire: int) -> None:
+    """Best-effort raw SET with TTL; a silent no-op when the backend is down."""
+    try:
+        await FastAPICache.get_backend().set(key, value, expire=expire)
+    except Exception:
+        pass
+
+
+async def cache_delete(key: str) -> None:
+    """Best-effort single-key invalidation."""
+    try:
+        await FastAPICache.clear(key=key)
+    except Exception:
+        pass
+
+
+async def invalidate_user_cache(user_id: int) -> None:
+    """Clear all cached responses for a user (after transaction/category writes).
+
+    Best-effort: cache misses on the next read are acceptable, a failed
+    invalidation that serves stale analytics is not — so log and continue
+    when the cache backend is unavailable (e.g. in tests).
+    """
+    try:
+        await FastAPICache.clear(namespace=f"user:{user_id}")
+    except Exception as e:  # cache not initialized or Redis down
+        logger.warning("cache_invalidation_failed", user_id=user_id, error=str(e))
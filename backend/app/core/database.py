@@ -1,7 +1,6 @@
 """Database engine and session factory."""
 
-from collections.abc import AsyncGenerator
-
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import settings
@@ -10,8 +9,13 @@ engine = create_async_engine(
     settings.database_url,
     echo=settings.app_debug,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    # Sized for burst load: 20 persistent + 10 overflow connections keeps
+    # concurrent requests from hitting "QueuePool limit reached" timeouts.
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    # Recycle connections before Postgres/infra idle timeouts kill them.
+    pool_recycle=1800,
 )
 
 async_session_factory = async_sessionmaker(
@@ -21,12 +25,10 @@ async_session_factory = async_sessionmaker(
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency that provides a database session."""
-    async with async_session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
+def get_db(request: Request) -> AsyncSession:
+    """Dependency returning the request-scoped session.
+
+    The session is created (and committed/rolled back) by DBSessionMiddleware,
+    so however many dependencies ask for it, a request uses exactly one.
+    """
+    return request.state.db
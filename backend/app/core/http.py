@@ -0,0 +1,27 @@
+"""Shared outbound HTTP client.
+
+One process-wide httpx.AsyncClient so repeated calls to external services
+(Ollama, mainly) reuse pooled TCP connections instead of paying socket and
+pool setup on every request. Timeouts are passed per call; the client itself
+carries no default beyond httpx's.
+"""
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it lazily (async contexts only)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient()
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (called from the lifespan shutdown)."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
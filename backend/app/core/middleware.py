@@ -1,4 +1,4 @@
-"""Application middleware: logging, rate limiting, etc."""
+"""Application middleware: logging, database session, rate limiting, etc."""
 
 import time
 
@@ -6,9 +6,75 @@ import structlog
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.database import async_session_factory
+
 logger = structlog.get_logger()
 
 
+class DBSessionMiddleware(BaseHTTPMiddleware):
+    """Provide a single request-scoped AsyncSession on ``request.state.db``.
+
+    Every ``Depends(get_db)`` in the dependency graph resolves to the same
+    session, guaranteeing at most one pooled connection per request (the
+    session only acquires a connection on first use, so DB-less endpoints
+    stay free). Commits on success, rolls back on error responses — the same
+    contract the per-dependency session had.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        async with async_session_factory() as session:
+            request.state.db = session
+            try:
+                response = await call_next(request)
+            except Exception:
+                await session.rollback()
+                raise
+            if response.status_code < 400:
+                await session.commit()
+            else:
+                await session.rollback()
+            return response
+
+
+# Client-side cache policies for low-volatility GET endpoints. The metamodel
+# only changes on deploy; analytics and the category tree are per-user and
+# already served from Redis server-side, so a short browser max-age plus
+# stale-while-revalidate turns repeat dashboard navigations into zero requests.
+_CACHEABLE_GET_PATHS = {
+    "/api/v1/ai/metamodel": "public, max-age=3600, immutable",
+    "/api/v1/analytics/by-category": "private, max-age=60, stale-while-revalidate=300",
+    "/api/v1/analytics/category-detail": "private, max-age=60, stale-while-revalidate=300",
+    "/api/v1/categories": "private, max-age=60, stale-while-revalidate=300",
+}
+
+
+class CacheHeadersMiddleware(BaseHTTPMiddleware):
+    """Emit ``Cache-Control`` + ``Vary: Authorization`` on cacheable GETs.
+
+    Applied in middleware (not per endpoint) so the headers are also present
+    on server-cache hits that never reach the route handler. Endpoints that
+    set their own Cache-Control (e.g. SSE streams) are left untouched.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.method == "GET" and response.status_code in (200, 304):
+            directive = _CACHEABLE_GET_PATHS.get(request.url.path)
+            if directive and "cache-control" not in response.headers:
+                response.headers["Cache-Control"] = directive
+                # Responses are authenticated: shared caches must key on the
+                # Authorization header, never mix users. Append rather than
+                # assign — CORSMiddleware already set "Vary: Origin" on
+                # credentialed responses and clobbering it would let a cached
+                # response replay with another origin's CORS headers.
+                vary = response.headers.get("Vary")
+                if not vary:
+                    response.headers["Vary"] = "Authorization"
+                elif "authorization" not in vary.lower():
+                    response.headers["Vary"] = f"{vary}, Authorization"
+        return response
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Log each incoming request with timing information."""
 
@@ -1,12 +1,13 @@
 """Security utilities: JWT tokens, password hashing, auth dependencies."""
 
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 
 import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -58,6 +59,45 @@ def decode_token(token: str) -> dict:
 # ── Auth Dependencies ─────────────────────────────
 security_scheme = HTTPBearer()
 
+# Verified-token cache: token hash → (expiry, user_id). Skips signature
+# verification on repeated requests from the same client; bounded TTL keeps
+# entries well inside the token's own lifetime.
+_TOKEN_CACHE_TTL = 300.0  # seconds
+_TOKEN_CACHE_MAX = 50_000
+_token_cache: dict[str, tuple[float, int]] = {}
+
+
+def _cached_user_id(token: str) -> int | None:
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+    entry = _token_cache.get(key)
+    if entry is not None and entry[0] > time.time():
+        return entry[1]
+    return None
+
+
+def _cache_user_id(token: str, user_id: int, token_exp: float | None) -> None:
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+    if len(_token_cache) >= _TOKEN_CACHE_MAX:
+        _token_cache.clear()
+    expiry = time.time() + _TOKEN_CACHE_TTL
+    if token_exp is not None:
+        expiry = min(expiry, float(token_exp))  # never outlive the token itself
+    _token_cache[key] = (expiry, user_id)
+
+
+# Short-lived user-row cache: user id → (expiry, column snapshot). Paired
+# with the token cache above, a warm request authenticates without touching
+# the database at all. The TTL bounds how long a deactivated user can still
+# pass the is_active check.
+_USER_CACHE_TTL = 30.0  # seconds
+_USER_CACHE_MAX = 10_000
+_user_cache: dict[int, tuple[float, dict]] = {}
+
+
+def invalidate_user_auth_cache(user_id: int) -> None:
+    """Drop the cached auth row (call after profile or deactivation writes)."""
+    _user_cache.pop(user_id, None)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
@@ -66,19 +106,34 @@ async def get_current_user(
     """FastAPI dependency: extract and validate JWT, return current user."""
     from app.models.user import User
 
-    payload = decode_token(credentials.credentials)
-
-    if payload.get("type") != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token type",
-        )
-
-    user_id = int(payload["sub"])
-    result = await db.execute(select(User).where(User.id == user_id, User.is_active.is_(True)))
-    user = result.scalar_one_or_none()
-
-    if user is None:
+    token = credentials.credentials
+    user_id = _cached_user_id(token)
+
+    if user_id is None:
+        payload = decode_token(token)
+
+        if payload.get("type") != "access":
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token type",
+            )
+        user_id = int(payload["sub"])
+        _cache_user_id(token, user_id, payload.get("exp"))
+
+    entry = _user_cache.get(user_id)
+    if entry is not None and entry[0] > time.time():
+        # Rebuild a transient instance from the snapshot — handlers only read
+        # column attributes from current_user, never its relationships.
+        user = User(**entry[1])
+    else:
+        user = await db.get(User, user_id)
+        if user is not None:
+            if len(_user_cache) >= _USER_CACHE_MAX:
+                _user_cache.clear()
+            snapshot = {c.key: getattr(user, c.key) for c in User.__table__.columns}
+            _user_cache[user_id] = (time.time() + _USER_CACHE_TTL, snapshot)
+
+    if user is None or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found or inactive",
@@ -1,15 +1,27 @@
 """MyFinance API — Main entry point."""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.redis import RedisBackend
+from redis import asyncio as aioredis
 from sqlalchemy import text
 
 from app.config import settings
+from app.core.cache import CACHE_PREFIX
 from app.core.database import async_session_factory, engine
-from app.core.middleware import RequestLoggingMiddleware
+from app.core.http import close_http_client
+from app.core.middleware import (
+    CacheHeadersMiddleware,
+    DBSessionMiddleware,
+    RequestLoggingMiddleware,
+)
 
 logger = structlog.get_logger()
 
@@ -19,9 +31,22 @@ async def lifespan(app: FastAPI):
     """Application lifespan: startup and shutdown events."""
     # Startup
     logger.info("Starting MyFinance API", env=settings.app_env)
+    redis = aioredis.from_url(settings.redis_url)
+    FastAPICache.init(RedisBackend(redis), prefix=CACHE_PREFIX)
+    # Load + warm the embedding model now so the first embedding request
+    # doesn't pay the weight load. Best-effort: embeddings stay lazy if the
+    # model can't load here (e.g. no model cache and no network).
+    try:
+        from app.services.embedding_service import warm_up_model
+
+        await asyncio.to_thread(warm_up_model)
+    except Exception as e:  # noqa: BLE001 — startup must not die on warmup
+        logger.warning("embedding_warmup_failed", error=str(e))
     yield
     # Shutdown
     logger.info("Shutting down MyFinance API")
+    await close_http_client()
+    await redis.aclose()
     await engine.dispose()
 
 
@@ -35,6 +60,9 @@ app = FastAPI(
     # Disable trailing slash redirects (307/308) which strip Authorization headers
     # when the frontend proxy follows the redirect cross-origin.
     redirect_slashes=False,
+    # Serialize every response body with orjson (C encoder) instead of the
+    # stdlib json encoder.
+    default_response_class=ORJSONResponse,
 )
 
 # ── Middleware ─────────────────────────────────────
@@ -46,6 +74,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(DBSessionMiddleware)
+app.add_middleware(CacheHeadersMiddleware)
+# Compress large JSON bodies (transaction pages, clusters) for clients that
+# send Accept-Encoding: gzip; small responses skip compression entirely.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 # ── Health Check ──────────────────────────────────
@@ -82,3 +115,19 @@ app.include_router(classification.router, prefix="/api/v1/classification", tags=
 app.include_router(classification_rules.router, prefix="/api/v1/classification-rules", tags=["classification-rules"])
 app.include_router(analytics.router, prefix="/api/v1/analytics", tags=["analytics"])
 app.include_router(ai.router, prefix="/api/v1/ai", tags=["ai"])
+
+
+# Sanity check: a duplicate (method, path) registration would shadow the real
+# handler and add dead route-matching work to every request. Fail fast at
+# import time instead of serving from the wrong copy.
+def _assert_no_duplicate_routes() -> None:
+    seen: set[tuple[str, str]] = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            key = (method, route.path)
+            if key in seen:
+                raise RuntimeError(f"Duplicate route registration: {method} {route.path}")
+            seen.add(key)
+
+
+_assert_no_duplicate_routes()
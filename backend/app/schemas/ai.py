@@ -121,6 +121,7 @@ class ProviderStatusResponse(BaseModel):
     model_name: str = ""
     providers: list[ProviderOption] = []
     current_provider: str = ""  # effective provider id (may differ from env if overridden)
+    stale: bool = False  # True when served from last-known-good cache after a provider error
 
 
 class AIConfigUpdate(BaseModel):
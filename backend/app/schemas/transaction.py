@@ -64,7 +64,7 @@ class TransactionFilter(BaseModel):
 
 class PaginatedResponse(BaseModel):
     data: list[TransactionResponse]
-    meta: dict  # {total, page, per_page, pages}
+    meta: dict  # {total, page, per_page, pages, next_cursor}
 
 
 class FileBalanceInfo(BaseModel):
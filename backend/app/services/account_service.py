@@ -26,9 +26,25 @@ class AccountService:
         )
         accounts = result.scalars().all()
 
+        # One grouped aggregate for every balance instead of a SUM per account.
+        sums: dict[int, Decimal] = {}
+        if accounts:
+            rows = await self.db.execute(
+                select(
+                    Transaction.account_id,
+                    func.coalesce(func.sum(Transaction.amount), 0),
+                )
+                .where(
+                    Transaction.account_id.in_([acc.id for acc in accounts]),
+                    Transaction.deleted_at.is_(None),
+                )
+                .group_by(Transaction.account_id)
+            )
+            sums = {account_id: total for account_id, total in rows.all()}
+
         enriched = []
         for acc in accounts:
-            balance = await self._calculate_balance(acc)
+            balance = acc.initial_balance + sums.get(acc.id, Decimal("0.00"))
             data = {
                 "id": acc.id,
                 "name": acc.name,
@@ -63,7 +79,6 @@ class AccountService:
         )
         self.db.add(account)
         await self.db.flush()
-        await self.db.refresh(account)
         return account
 
     async def get_account(self, account_id: int, user: User) -> Account:
@@ -78,7 +93,6 @@ class AccountService:
         for key, value in update_data.items():
             setattr(account, key, value)
         await self.db.flush()
-        await self.db.refresh(account)
         return account
 
     async def archive_account(self, account_id: int, user: User) -> None:
@@ -121,7 +135,6 @@ class AccountService:
         account.balance_reference_date = ref_date
         account.balance_reference_amount = ref_amount
         await self.db.flush()
-        await self.db.refresh(account)
 
         # Return enriched response
         current_balance = await self._calculate_balance(account)
@@ -54,12 +54,13 @@ class AIClassificationService:
         """
         from app.models.account import Account
 
-        # Fetch uncategorized transactions
-        user_accounts = select(Account.id).where(Account.user_id == user.id)
+        # Fetch uncategorized transactions (join on Account for ownership —
+        # keeps the planner on the indexes instead of an IN-subquery)
         query = (
             select(Transaction)
+            .join(Account, Account.id == Transaction.account_id)
             .where(
-                Transaction.account_id.in_(user_accounts),
+                Account.user_id == user.id,
                 Transaction.category_id.is_(None),
                 Transaction.deleted_at.is_(None),
             )
@@ -153,12 +154,11 @@ class AIClassificationService:
         """
         from app.models.account import Account
 
-        user_accounts = select(Account.id).where(Account.user_id == user.id)
-
         result = await self.db.execute(
             select(Transaction)
+            .join(Account, Account.id == Transaction.account_id)
             .where(
-                Transaction.account_id.in_(user_accounts),
+                Account.user_id == user.id,
                 Transaction.category_id.is_not(None),
                 Transaction.deleted_at.is_(None),
                 # Prefer user-corrected transactions (no ai_confidence = manual)
@@ -1,5 +1,7 @@
 """Authentication service."""
 
+import asyncio
+
 from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -31,12 +33,15 @@ class AuthService:
 
         user = User(
             email=data.email,
-            password_hash=hash_password(data.password),
+            # bcrypt at 12 rounds is ~200 ms of pure CPU — run it in a worker
+            # thread so the event loop keeps serving other requests.
+            password_hash=await asyncio.to_thread(hash_password, data.password),
             full_name=data.full_name,
         )
         self.db.add(user)
+        # flush() emits INSERT .. RETURNING id; timestamps have client-side
+        # defaults, so a follow-up refresh() would be a redundant SELECT.
         await self.db.flush()
-        await self.db.refresh(user)
 
         # Auto-login: generate tokens immediately
         return AuthResponse(
@@ -52,7 +57,10 @@ class AuthService:
         )
         user = result.scalar_one_or_none()
 
-        if not user or not verify_password(data.password, user.password_hash):
+        # Same event-loop concern as register: bcrypt verify is CPU-bound.
+        if not user or not await asyncio.to_thread(
+            verify_password, data.password, user.password_hash
+        ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Email ou mot de passe incorrect",
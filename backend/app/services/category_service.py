@@ -60,7 +60,6 @@ class CategoryService:
         )
         self.db.add(category)
         await self.db.flush()
-        await self.db.refresh(category)
         return {
             "id": category.id,
             "name": category.name,
@@ -80,7 +79,6 @@ class CategoryService:
         for key, value in update_data.items():
             setattr(category, key, value)
         await self.db.flush()
-        await self.db.refresh(category)
         return {
             "id": category.id,
             "name": category.name,
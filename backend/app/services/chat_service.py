@@ -16,12 +16,14 @@ Architecture (v2 — dataviz query engine):
 import json
 import re
 import time
+from collections.abc import AsyncIterator
 
 import structlog
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
+from app.core.database import async_session_factory
 from app.models.account import Account
 from app.models.conversation import Conversation, Message
 from app.models.user import User
@@ -288,6 +290,53 @@ def convert_raw_to_placeholders(content: str, charts: list) -> str:
     return result.strip()
 
 
+def _sse_event(payload: dict) -> bytes:
+    """Encode a payload as a Server-Sent Events data frame."""
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode()
+
+
+async def chat_stream(
+    user: User,
+    content: str,
+    conversation_id: int | None = None,
+    account_ids: list[int] | None = None,
+) -> AsyncIterator[bytes]:
+    """Stream a chat turn as SSE frames.
+
+    Opens its own session: the request-scoped one is committed and closed by
+    the middleware before the response body finishes streaming.
+    """
+    async with async_session_factory() as db:
+        service = ChatService(db)
+        try:
+            async for event in service._chat_stream_events(
+                user, content, conversation_id, account_ids
+            ):
+                yield event
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error("chat_stream_failed", error=str(e), error_type=type(e).__name__)
+            yield _sse_event({"type": "done", "message": "", "charts": [], "error": str(e)})
+
+
+# ---------------------------------------------------------------------------
+# Account-scope cache — ownership data is essentially static within a
+# dashboard burst, so avoid one DB round-trip per interactive dataviz query.
+# Keyed by (user_id, requested account set); invalidated on account CRUD.
+# ---------------------------------------------------------------------------
+
+_SCOPE_CACHE_TTL = 60.0  # seconds
+_SCOPE_CACHE_MAX = 10_000
+_scope_cache: dict[tuple, tuple[float, list[int]]] = {}
+
+
+def invalidate_account_scope_cache(user_id: int) -> None:
+    """Drop cached account scopes for a user (call after account CRUD)."""
+    for key in [k for k in _scope_cache if k[0] == user_id]:
+        _scope_cache.pop(key, None)
+
+
 # ---------------------------------------------------------------------------
 # Service
 # ---------------------------------------------------------------------------
@@ -450,6 +499,104 @@ class ChatService:
 
         return result
 
+    async def _chat_stream_events(
+        self,
+        user: User,
+        content: str,
+        conversation_id: int | None = None,
+        account_ids: list[int] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Yield SSE events for a chat turn: meta, token deltas, then done.
+
+        Same pipeline as chat() but the LLM text is forwarded to the client as
+        it arrives; dataviz blocks are parsed and executed once the full text
+        is known, and the final 'done' event carries the same payload shape as
+        the non-streaming endpoint.
+        """
+        scope_account_ids = await self._resolve_account_scope(user, account_ids)
+        context = QueryContext(user_id=user.id, account_ids=scope_account_ids)
+
+        conversation = await self._get_or_create_conversation(user, conversation_id)
+
+        user_msg = Message(
+            conversation_id=conversation.id,
+            role="user",
+            content=content,
+        )
+        self.db.add(user_msg)
+        await self.db.flush()
+
+        yield _sse_event({"type": "meta", "conversation_id": conversation.id})
+
+        system_prompt = await self._build_system_prompt(user, scope_account_ids)
+        history = await self._get_message_history(conversation.id, limit=10)
+
+        chunks: list[str] = []
+        try:
+            async for delta in self.llm.chat_stream(
+                system_prompt=system_prompt,
+                messages=history,
+                temperature=0.3,
+            ):
+                chunks.append(delta)
+                yield _sse_event({"type": "delta", "delta": delta})
+        except Exception as e:
+            error_msg = f"Erreur LLM ({type(self.llm).__name__}): {e}"
+            logger.error("llm_stream_error", error=str(e), provider=type(self.llm).__name__)
+            yield _sse_event({
+                "type": "done",
+                "conversation_id": conversation.id,
+                "message": "",
+                "charts": [],
+                "metadata": {"provider": type(self.llm).__name__},
+                "error": error_msg,
+            })
+            return
+
+        response_text = "".join(chunks)
+
+        # Execute dataviz blocks now that the full text is available
+        dataviz_blocks = parse_dataviz_blocks(response_text)
+        charts = []
+        blocks_with_charts: list[tuple[str, dict | None]] = []
+        for block_text, block_data in dataviz_blocks:
+            chart, _trace = await self._execute_dataviz_block(block_data, context)
+            blocks_with_charts.append((block_text, chart))
+            if chart:
+                charts.append(chart)
+
+        display_message = build_message_with_placeholders(response_text, blocks_with_charts)
+
+        # Persist assistant message (best-effort, as in chat())
+        try:
+            assistant_msg = Message(
+                conversation_id=conversation.id,
+                role="assistant",
+                content=display_message,
+                metadata_={
+                    "charts": charts,
+                    "provider": type(self.llm).__name__,
+                    "model_name": self.llm.get_model_name(),
+                },
+            )
+            self.db.add(assistant_msg)
+            if len(history) <= 1:
+                conversation.title = content[:100]
+            await self.db.flush()
+        except Exception as save_err:
+            logger.warning("chat_save_message_failed", error=str(save_err))
+
+        yield _sse_event({
+            "type": "done",
+            "conversation_id": conversation.id,
+            "message": display_message,
+            "charts": charts,
+            "metadata": {
+                "provider": type(self.llm).__name__,
+                "model_name": self.llm.get_model_name(),
+            },
+        })
+
     async def _execute_dataviz_block(
         self, block: dict, context: QueryContext, collect_debug: bool = False
     ) -> tuple[dict | None, dict | None]:
@@ -531,7 +678,16 @@ class ChatService:
 
         If account_ids provided, intersect with user's actual accounts.
         If None, use all user accounts.
+
+        Resolutions are cached per (user, requested set) for a short TTL so
+        dataviz panel bursts don't re-query essentially-static ownership data.
         """
+        cache_key = (user.id, tuple(sorted(account_ids)) if account_ids else None)
+        now = time.monotonic()
+        cached = _scope_cache.get(cache_key)
+        if cached is not None and now - cached[0] < _SCOPE_CACHE_TTL:
+            return list(cached[1])
+
         result = await self.db.execute(
             select(Account.id).where(
                 Account.user_id == user.id,
@@ -541,9 +697,14 @@ class ChatService:
         all_user_accounts = [r for r in result.scalars().all()]
 
         if account_ids:
-            return [aid for aid in account_ids if aid in all_user_accounts]
+            scope = [aid for aid in account_ids if aid in all_user_accounts]
+        else:
+            scope = all_user_accounts
 
-        return all_user_accounts
+        if len(_scope_cache) >= _SCOPE_CACHE_MAX:
+            _scope_cache.clear()
+        _scope_cache[cache_key] = (now, list(scope))
+        return scope
 
     async def _build_system_prompt(
         self, user: User, account_ids: list[int]
@@ -581,7 +742,10 @@ class ChatService:
     ) -> Conversation | None:
         result = await self.db.execute(
             select(Conversation)
-            .options(selectinload(Conversation.messages))
+            # Messages are eager-loaded in one batched SELECT (2 queries total,
+            # regardless of message count); raiseload turns any future lazy
+            # access into an error instead of a silent N+1.
+            .options(selectinload(Conversation.messages), raiseload("*"))
             .where(
                 Conversation.id == conversation_id,
                 Conversation.user_id == user.id,
@@ -637,7 +801,6 @@ class ChatService:
         )
         self.db.add(conv)
         await self.db.flush()
-        await self.db.refresh(conv)
         return conv
 
     async def _get_message_history(
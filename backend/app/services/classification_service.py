@@ -11,6 +11,7 @@ from sqlalchemy.orm import selectinload
 from app.models.account import Account
 from app.models.classification_proposal import ClassificationProposal, ClassificationProposalCluster
 from app.models.user import User
+from app.schemas.classification import ClusterUpdate
 
 logger = structlog.get_logger()
 
@@ -145,7 +146,6 @@ class ClassificationService:
             )
             self.db.add(c)
         await self.db.flush()
-        await self.db.refresh(proposal)
         result = await self.db.execute(
             select(ClassificationProposal)
             .where(ClassificationProposal.id == proposal.id)
@@ -166,9 +166,14 @@ class ClassificationService:
         self,
         user: User,
         account_id: int,
-        cluster_updates: list[dict],
+        cluster_updates: list[ClusterUpdate],
     ) -> dict | None:
-        """Update cluster states (status, override, excluded_ids, etc.)."""
+        """Update cluster states (status, override, excluded_ids, etc.).
+
+        Takes the validated Pydantic models directly; __pydantic_fields_set__
+        distinguishes "field sent" from "field left out" without dumping each
+        update to an intermediate dict.
+        """
         proposal = await self.db.execute(
             select(ClassificationProposal)
             .where(
@@ -183,23 +188,22 @@ class ClassificationService:
 
         cluster_by_id = {c.id: c for c in proposal.clusters}
         for upd in cluster_updates:
-            cid = upd.get("cluster_id")
-            if cid not in cluster_by_id:
+            c = cluster_by_id.get(upd.cluster_id)
+            if c is None:
                 continue
-            c = cluster_by_id[cid]
-            if "status" in upd and upd["status"]:
-                c.status = upd["status"]
-            if "override_category_id" in upd:
-                c.override_category_id = upd["override_category_id"]
-            if "rule_pattern" in upd:
-                c.rule_pattern = upd["rule_pattern"] or None
-            if "custom_label" in upd:
-                c.custom_label = upd["custom_label"] or None
-            if "excluded_ids" in upd:
-                c.excluded_ids = upd["excluded_ids"] or None
+            sent = upd.__pydantic_fields_set__
+            if "status" in sent and upd.status:
+                c.status = upd.status
+            if "override_category_id" in sent:
+                c.override_category_id = upd.override_category_id
+            if "rule_pattern" in sent:
+                c.rule_pattern = upd.rule_pattern or None
+            if "custom_label" in sent:
+                c.custom_label = upd.custom_label or None
+            if "excluded_ids" in sent:
+                c.excluded_ids = upd.excluded_ids or None
 
         await self.db.flush()
-        await self.db.refresh(proposal)
         result = await self.db.execute(
             select(ClassificationProposal)
             .where(ClassificationProposal.id == proposal.id)
@@ -309,11 +313,12 @@ class ClassificationService:
             if await llm_service.is_available():
                 # Fetch transactions from DB to ensure correct IDs and format (cluster.transactions
                 # from JSONB can have type inconsistencies, e.g. id as float)
-                user_accounts = select(Account.id).where(Account.user_id == user.id)
                 txn_result = await self.db.execute(
-                    select(Transaction).where(
+                    select(Transaction)
+                    .join(Account, Account.id == Transaction.account_id)
+                    .where(
                         Transaction.id.in_(txn_ids),
-                        Transaction.account_id.in_(user_accounts),
+                        Account.user_id == user.id,
                     )
                 )
                 txns_from_db = list(txn_result.scalars().all())
@@ -415,7 +420,6 @@ class ClassificationService:
             )
             self.db.add(c)
         await self.db.flush()
-        await self.db.refresh(proposal)
 
         result = await self.db.execute(
             select(ClassificationProposal)
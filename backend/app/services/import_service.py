@@ -1,11 +1,11 @@
 """File import service for transactions."""
 
+import asyncio
 import hashlib
-import re
 from datetime import date, timedelta
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import NotFoundError, ValidationError
@@ -14,6 +14,7 @@ from app.models.transaction import ImportLog, Transaction
 from app.models.user import User
 from app.services.label_parser import parse_label
 from app.utils.file_parsers import (
+    FileSource,
     ParsedTransaction,
     parse_csv,
     parse_excel,
@@ -36,6 +37,20 @@ SUPPORTED_EXTENSIONS = sorted(_PARSERS.keys())
 # (même transaction avec date légèrement différente selon l'export)
 DEDUP_DATE_WINDOW_DAYS = 7
 
+# Accent-fold table for dedup normalization, built once at import. translate()
+# walks the string a single time in C; the usual French bank-label accents map
+# to their ASCII base so exports that differ only in encoding still match.
+_FOLD_TABLE = str.maketrans({
+    "à": "a", "â": "a", "ä": "a", "á": "a",
+    "ç": "c",
+    "è": "e", "é": "e", "ê": "e", "ë": "e",
+    "î": "i", "ï": "i", "í": "i",
+    "ô": "o", "ö": "o", "ó": "o",
+    "ù": "u", "û": "u", "ü": "u", "ú": "u",
+    "ÿ": "y",
+    "œ": "oe", "æ": "ae",
+})
+
 
 class ImportService:
     def __init__(self, db: AsyncSession):
@@ -46,9 +61,13 @@ class ImportService:
         user: User,
         account_id: int,
         filename: str,
-        content: bytes,
+        content: FileSource,
     ) -> dict:
-        """Import transactions from a file (CSV, Excel, OFX/QFX)."""
+        """Import transactions from a file (CSV, Excel, OFX/QFX).
+
+        content may be raw bytes or a binary file object (e.g. the spooled
+        temp file of a streamed upload).
+        """
         # Verify account ownership
         result = await self.db.execute(select(Account).where(Account.id == account_id))
         account = result.scalar_one_or_none()
@@ -67,9 +86,10 @@ class ImportService:
 
         parser_fn, fmt = _PARSERS[ext]
 
-        # Parse the file
+        # Parse the file in a worker thread — CSV/Excel/OFX parsing is pure
+        # CPU and would otherwise block the event loop for the whole file.
         try:
-            parsed_txns: list[ParsedTransaction] = parser_fn(content)
+            parsed_txns: list[ParsedTransaction] = await asyncio.to_thread(parser_fn, content)
         except Exception as e:
             raise ValidationError(f"Erreur de parsing du fichier : {e}") from e
 
@@ -84,6 +104,9 @@ class ImportService:
         # → index = ordre parmi les transactions identiques (#1, #2, #3...)
         hash_base_counts: dict[tuple[date, Decimal, str], int] = {}
 
+        # Prepare all rows first so both dedup checks run as single queries
+        # instead of two SELECTs per row.
+        prepared: list[tuple[int, ParsedTransaction, str, str]] = []
         for i, pt in enumerate(parsed_txns, start=1):
             try:
                 label = pt.label or "(sans libellé)"
@@ -97,45 +120,76 @@ class ImportService:
 
                 dedup_hash = self._compute_hash(pt.date, pt.amount, label, index=index)
 
-                # Check for duplicate: 1) exact hash, 2) fuzzy (amount+label in date window)
-                existing = await self.db.execute(
-                    select(Transaction).where(
-                        Transaction.dedup_hash == dedup_hash,
-                        Transaction.deleted_at.is_(None),
-                    )
+                label_raw = label
+                if pt.memo and pt.memo != label:
+                    label_raw = f"{label} — {pt.memo}"
+                prepared.append((i, pt, label_raw, dedup_hash))
+            except Exception as e:
+                errors.append(f"Transaction {i}: {e}")
+
+        # Exact dedup: fetch every already-known hash in one query
+        existing_hashes: set[str] = set()
+        if prepared:
+            result = await self.db.execute(
+                select(Transaction.dedup_hash).where(
+                    Transaction.dedup_hash.in_([h for _, _, _, h in prepared]),
+                    Transaction.deleted_at.is_(None),
                 )
-                if existing.scalar_one_or_none():
+            )
+            existing_hashes = set(result.scalars().all())
+
+        # Fuzzy dedup: fetch all candidates for the batch's date span in one
+        # query and index them by (amount, normalized label).
+        fuzzy_index = await self._build_fuzzy_index(
+            account_id,
+            min(p[1].date for p in prepared) if prepared else None,
+            max(p[1].date for p in prepared) if prepared else None,
+        )
+
+        rows: list[dict] = []
+        for i, pt, label_raw, dedup_hash in prepared:
+            try:
+                if dedup_hash in existing_hashes:
                     duplicates += 1
                     continue
 
                 # Fuzzy dedup: même transaction dans un autre fichier (date légèrement différente)
-                label_raw = label
-                if pt.memo and pt.memo != label:
-                    label_raw = f"{label} — {pt.memo}"
-                if await self._is_duplicate_fuzzy(account_id, pt.date, pt.amount, label_raw):
+                if self._is_duplicate_in_index(fuzzy_index, pt.date, pt.amount, label_raw):
                     duplicates += 1
                     continue
 
                 # Parse structured metadata from the raw label
                 parsed_metadata = parse_label(label_raw)
 
-                txn = Transaction(
-                    account_id=account_id,
-                    date=pt.date,
-                    label_raw=label_raw,
-                    parsed_metadata=parsed_metadata,
-                    amount=pt.amount,
-                    currency=account.currency,
-                    dedup_hash=dedup_hash,
-                    source=f"import_{fmt}",
-                )
-                self.db.add(txn)
+                rows.append({
+                    "account_id": account_id,
+                    "date": pt.date,
+                    "label_raw": label_raw,
+                    "parsed_metadata": parsed_metadata,
+                    "amount": pt.amount,
+                    "currency": account.currency,
+                    "dedup_hash": dedup_hash,
+                    "source": f"import_{fmt}",
+                })
+                # Accepted rows become fuzzy candidates for the rest of the
+                # batch (same visibility the per-row autoflush used to give).
+                fuzzy_index.setdefault(
+                    (pt.amount, self._normalize_label_for_dedup(label_raw)), []
+                ).append(pt.date)
                 imported += 1
-
             except Exception as e:
                 errors.append(f"Transaction {i}: {e}")
 
-        await self.db.flush()
+        # One bulk INSERT (insertmanyvalues batches the whole list) instead of
+        # a unit-of-work flush per ORM instance. RETURNING hands back the new
+        # ids so the post-import passes (rules, embeddings) can target exactly
+        # these rows instead of rescanning the account.
+        new_ids: list[int] = []
+        if rows:
+            result = await self.db.execute(
+                insert(Transaction).returning(Transaction.id), rows
+            )
+            new_ids = list(result.scalars().all())
 
         # Log the import
         log = ImportLog(
@@ -159,6 +213,7 @@ class ImportService:
             "duplicate_count": duplicates,
             "error_count": len(errors),
             "errors": errors[:20] if errors else None,
+            "new_ids": new_ids,
         }
 
     @staticmethod
@@ -173,15 +228,51 @@ class ImportService:
 
     @staticmethod
     def _normalize_label_for_dedup(label: str) -> str:
-        """Normalise le libellé pour comparaison (espaces, casse, espaces multiples)."""
+        """Normalise le libellé pour comparaison (casse, accents, espaces).
+
+        Chaque étape est une seule passe en C (lower, translate, split) — pas
+        de regex ni de boucle Python, cette fonction tourne une fois par ligne
+        existante et importée.
+        """
         if not label:
             return ""
-        s = label.strip().lower()
-        s = re.sub(r"\s+", " ", s)
-        return s
+        return " ".join(label.lower().translate(_FOLD_TABLE).split())
+
+    async def _build_fuzzy_index(
+        self,
+        account_id: int,
+        batch_date_min: date | None,
+        batch_date_max: date | None,
+    ) -> dict[tuple[Decimal, str], list[date]]:
+        """Index (montant, libellé normalisé) → dates des transactions existantes.
 
-    async def _is_duplicate_fuzzy(
-        self, account_id: int, txn_date: date, amount: Decimal, label_raw: str
+        Couvre la plage de dates du lot élargie de la fenêtre de dédup, en une
+        seule requête — remplace la recherche floue par ligne importée.
+        """
+        if batch_date_min is None or batch_date_max is None:
+            return {}
+
+        result = await self.db.execute(
+            select(Transaction.date, Transaction.amount, Transaction.label_raw).where(
+                Transaction.account_id == account_id,
+                Transaction.date >= batch_date_min - timedelta(days=DEDUP_DATE_WINDOW_DAYS),
+                Transaction.date <= batch_date_max + timedelta(days=DEDUP_DATE_WINDOW_DAYS),
+                Transaction.deleted_at.is_(None),
+            )
+        )
+        index: dict[tuple[Decimal, str], list[date]] = {}
+        for txn_date, amount, label_raw in result.all():
+            normalized = self._normalize_label_for_dedup(label_raw)
+            if normalized:
+                index.setdefault((amount, normalized), []).append(txn_date)
+        return index
+
+    def _is_duplicate_in_index(
+        self,
+        fuzzy_index: dict[tuple[Decimal, str], list[date]],
+        txn_date: date,
+        amount: Decimal,
+        label_raw: str,
     ) -> bool:
         """Détecte un doublon via montant + libellé dans une fenêtre de dates.
 
@@ -192,21 +283,8 @@ class ImportService:
         if not normalized:
             return False
 
-        date_min = txn_date - timedelta(days=DEDUP_DATE_WINDOW_DAYS)
-        date_max = txn_date + timedelta(days=DEDUP_DATE_WINDOW_DAYS)
-
-        result = await self.db.execute(
-            select(Transaction).where(
-                Transaction.account_id == account_id,
-                Transaction.amount == amount,
-                Transaction.date >= date_min,
-                Transaction.date <= date_max,
-                Transaction.deleted_at.is_(None),
-            )
+        candidates = fuzzy_index.get((amount, normalized), ())
+        return any(
+            abs((txn_date - candidate).days) <= DEDUP_DATE_WINDOW_DAYS
+            for candidate in candidates
         )
-        candidates = result.scalars().all()
-
-        for txn in candidates:
-            if self._normalize_label_for_dedup(txn.label_raw) == normalized:
-                return True
-        return False
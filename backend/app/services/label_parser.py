@@ -23,7 +23,11 @@ Examples:
     → payment_mode="CB", counterparty="LECLERC", operation_date extracted
 """
 
+import asyncio
+import math
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date as date_type
 
 import structlog
@@ -111,6 +115,17 @@ _CHECK_NUM_RE = re.compile(r"N[°O]?\s*(\d+)", re.IGNORECASE)
 # Multiple spaces → single space
 _MULTI_SPACE_RE = re.compile(r"\s{2,}")
 
+# Payment-mode lookup compiled once: a single alternation scan replaces the
+# linear startswith walk over PAYMENT_MODES (run up to twice per label). re
+# picks the first matching alternative, so the priority order above (longer
+# variants before their prefixes) is preserved.
+_MODE_TYPE: dict[str, str] = dict(PAYMENT_MODES)
+_MODE_ALTERNATION = "|".join(re.escape(mode) for mode, _ in PAYMENT_MODES)
+# Mode anywhere at the start, even glued to the next word (historic behavior)
+_MODE_MATCH_RE = re.compile(f"^({_MODE_ALTERNATION})")
+# Mode followed by whitespace or end of label (used when there is no separator)
+_MODE_SPLIT_RE = re.compile(f"^({_MODE_ALTERNATION})(?:\\s|$)")
+
 
 # ── Public API ──────────────────────────────────────────────────
 
@@ -239,8 +254,47 @@ def get_embedding_text(parsed_metadata: dict | None, label_raw: str) -> str:
 
 
 def parse_labels_batch(labels: list[str]) -> list[dict]:
-    """Parse a batch of labels. Convenience wrapper."""
-    return [parse_label(lbl) for lbl in labels]
+    """Parse a batch of labels with the parser bound once outside the loop."""
+    parse = parse_label
+    return [parse(lbl) for lbl in labels]
+
+
+# Worker pool for large re-parses. Regex parsing is pure-Python CPU and holds
+# the GIL, so threads cannot parallelize it — only processes escape it. The
+# pool is created lazily (most requests never need it) and kept for the life
+# of the process; workers import this module only, nothing heavyweight.
+_PARALLEL_MIN_LABELS = 2000
+_POOL_MAX_WORKERS = min(os.cpu_count() or 1, 4)
+_pool: ProcessPoolExecutor | None = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=_POOL_MAX_WORKERS)
+    return _pool
+
+
+async def parse_labels_parallel(labels: list[str]) -> list[dict]:
+    """Parse labels off the event loop, fanning out across cores when worth it.
+
+    Small batches stay in a single thread — inter-process pickling would cost
+    more than the parse. Large batches are split evenly over the process pool
+    for near-linear speedup with core count.
+    """
+    if len(labels) < _PARALLEL_MIN_LABELS or _POOL_MAX_WORKERS == 1:
+        return await asyncio.to_thread(parse_labels_batch, labels)
+
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    chunk = math.ceil(len(labels) / _POOL_MAX_WORKERS)
+    parts = await asyncio.gather(
+        *[
+            loop.run_in_executor(pool, parse_labels_batch, labels[i : i + chunk])
+            for i in range(0, len(labels), chunk)
+        ]
+    )
+    return [metadata for part in parts for metadata in part]
 
 
 # ── Private helpers ─────────────────────────────────────────────
@@ -250,10 +304,10 @@ def _match_payment_mode(text: str | None) -> tuple[str | None, str | None]:
     """Match a payment mode from the text. Returns (mode_label, type_code)."""
     if not text:
         return None, None
-    upper = text.upper().strip()
-    for mode_str, type_code in PAYMENT_MODES:
-        if upper == mode_str or upper.startswith(mode_str + " ") or upper.startswith(mode_str):
-            return mode_str, type_code
+    m = _MODE_MATCH_RE.match(text.upper().strip())
+    if m:
+        mode_str = m.group(1)
+        return mode_str, _MODE_TYPE[mode_str]
     return None, None
 
 
@@ -262,12 +316,10 @@ def _extract_mode_prefix(label: str) -> tuple[str | None, str]:
 
     Returns (mode_part_or_None, remaining_details).
     """
-    upper = label.upper()
-    for mode_str, _ in PAYMENT_MODES:
-        if upper.startswith(mode_str + " "):
-            return label[: len(mode_str)], label[len(mode_str) :].strip()
-        if upper == mode_str:
-            return label, ""
+    m = _MODE_SPLIT_RE.match(label.upper())
+    if m:
+        end = m.end(1)
+        return label[:end], label[end:].strip()
     return None, label
 
 
@@ -5,12 +5,15 @@ with a unified interface. The provider receives a system prompt + message
 history and returns the assistant's text response.
 """
 
+import json
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 import httpx
 import structlog
 
 from app.config import settings
+from app.core.http import get_http_client
 from app.services.ai_config import get_current_provider
 
 logger = structlog.get_logger()
@@ -37,6 +40,20 @@ class LLMProviderBase(ABC):
             The assistant's response text.
         """
 
+    async def chat_stream(
+        self,
+        system_prompt: str,
+        messages: list[dict],
+        temperature: float = 0.3,
+    ) -> AsyncIterator[str]:
+        """Yield the assistant's response incrementally.
+
+        Default implementation falls back to the non-streaming chat() and
+        yields the full text as a single chunk; providers with native
+        streaming support should override this.
+        """
+        yield await self.chat(system_prompt, messages, temperature)
+
     @abstractmethod
     async def is_available(self) -> bool:
         """Check if the provider is reachable."""
@@ -55,16 +72,17 @@ class OllamaChatProvider(LLMProviderBase):
 
     async def is_available(self) -> bool:
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(f"{self.base_url}/api/tags")
-                if resp.status_code != 200:
-                    return False
-                data = resp.json()
-                model_names = [m.get("name", "") for m in data.get("models", [])]
-                return any(
-                    n == self.model or n.startswith(f"{self.model}:")
-                    for n in model_names
-                )
+            resp = await get_http_client().get(
+                f"{self.base_url}/api/tags", timeout=5.0
+            )
+            if resp.status_code != 200:
+                return False
+            data = resp.json()
+            model_names = [m.get("name", "") for m in data.get("models", [])]
+            return any(
+                n == self.model or n.startswith(f"{self.model}:")
+                for n in model_names
+            )
         except (httpx.ConnectError, httpx.TimeoutException):
             return False
 
@@ -82,37 +100,89 @@ class OllamaChatProvider(LLMProviderBase):
             })
 
         try:
-            async with httpx.AsyncClient(
+            resp = await get_http_client().post(
+                f"{self.base_url}/api/chat",
+                json={
+                    "model": self.model,
+                    "messages": ollama_messages,
+                    "stream": False,
+                    "options": {
+                        "temperature": temperature,
+                        "num_predict": 1500,
+                    },
+                },
                 timeout=httpx.Timeout(
                     connect=5.0,
                     read=settings.llm_timeout,
                     write=5.0,
                     pool=5.0,
-                )
-            ) as client:
-                resp = await client.post(
-                    f"{self.base_url}/api/chat",
-                    json={
-                        "model": self.model,
-                        "messages": ollama_messages,
-                        "stream": False,
-                        "options": {
-                            "temperature": temperature,
-                            "num_predict": 1500,
-                        },
+                ),
+            )
+            if resp.status_code != 200:
+                logger.warning("ollama_chat_error", status=resp.status_code)
+                return "Désolé, le modèle local n'est pas disponible pour le moment."
+            data = resp.json()
+            return data.get("message", {}).get("content", "")
+        except httpx.TimeoutException:
+            logger.warning("ollama_chat_timeout")
+            return "Désolé, le modèle local a mis trop de temps à répondre."
+        except httpx.ConnectError:
+            logger.warning("ollama_chat_unreachable")
+            return "Désolé, le service Ollama n'est pas accessible."
+
+    async def chat_stream(
+        self,
+        system_prompt: str,
+        messages: list[dict],
+        temperature: float = 0.3,
+    ) -> AsyncIterator[str]:
+        """Stream token deltas from Ollama (line-delimited JSON with stream=True)."""
+        ollama_messages = [{"role": "system", "content": system_prompt}]
+        for msg in messages:
+            ollama_messages.append({
+                "role": msg["role"],
+                "content": msg["content"],
+            })
+
+        try:
+            async with get_http_client().stream(
+                "POST",
+                f"{self.base_url}/api/chat",
+                json={
+                    "model": self.model,
+                    "messages": ollama_messages,
+                    "stream": True,
+                    "options": {
+                        "temperature": temperature,
+                        "num_predict": 1500,
                     },
-                )
+                },
+                timeout=httpx.Timeout(
+                    connect=5.0,
+                    read=settings.llm_timeout,
+                    write=5.0,
+                    pool=5.0,
+                ),
+            ) as resp:
                 if resp.status_code != 200:
                     logger.warning("ollama_chat_error", status=resp.status_code)
-                    return "Désolé, le modèle local n'est pas disponible pour le moment."
-                data = resp.json()
-                return data.get("message", {}).get("content", "")
+                    yield "Désolé, le modèle local n'est pas disponible pour le moment."
+                    return
+                async for line in resp.aiter_lines():
+                    if not line.strip():
+                        continue
+                    data = json.loads(line)
+                    delta = data.get("message", {}).get("content", "")
+                    if delta:
+                        yield delta
+                    if data.get("done"):
+                        break
         except httpx.TimeoutException:
             logger.warning("ollama_chat_timeout")
-            return "Désolé, le modèle local a mis trop de temps à répondre."
+            yield "Désolé, le modèle local a mis trop de temps à répondre."
         except httpx.ConnectError:
             logger.warning("ollama_chat_unreachable")
-            return "Désolé, le service Ollama n'est pas accessible."
+            yield "Désolé, le service Ollama n'est pas accessible."
 
 
 class OpenAIChatProvider(LLMProviderBase):
@@ -9,6 +9,7 @@ categories.
 Ollama runs as a Docker service and exposes a simple HTTP API.
 """
 
+import asyncio
 import json
 import re
 
@@ -16,9 +17,16 @@ import httpx
 import structlog
 
 from app.config import settings
+from app.core.http import get_http_client
 
 logger = structlog.get_logger()
 
+# Ollama serializes generations on a single local model anyway: letting N
+# coroutines hit it concurrently just queues them server-side while each holds
+# its request open for the full backlog. Bound the fan-out here instead so
+# excess callers wait in-process and the timeout budget applies per call.
+_LLM_SEMAPHORE = asyncio.Semaphore(settings.llm_concurrency)
+
 
 class LLMService:
     """Classify transaction clusters using a local LLM via Ollama."""
@@ -30,17 +38,18 @@ class LLMService:
     async def is_available(self) -> bool:
         """Check if Ollama is reachable and has the configured model."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                resp = await client.get(f"{self.base_url}/api/tags")
-                if resp.status_code != 200:
-                    return False
-                data = resp.json()
-                model_names = [m.get("name", "") for m in data.get("models", [])]
-                # Check if any model name starts with our configured model
-                return any(
-                    n == self.model or n.startswith(f"{self.model}:")
-                    for n in model_names
-                )
+            resp = await get_http_client().get(
+                f"{self.base_url}/api/tags", timeout=5.0
+            )
+            if resp.status_code != 200:
+                return False
+            data = resp.json()
+            model_names = [m.get("name", "") for m in data.get("models", [])]
+            # Check if any model name starts with our configured model
+            return any(
+                n == self.model or n.startswith(f"{self.model}:")
+                for n in model_names
+            )
         except (httpx.ConnectError, httpx.TimeoutException):
             return False
 
@@ -433,17 +442,10 @@ Règles :
         return base
 
     async def _call_ollama(self, prompt: str, num_predict: int = 200) -> str | None:
-        """Call Ollama generate API."""
+        """Call Ollama generate API (at most llm_concurrency calls in flight)."""
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(
-                    connect=5.0,
-                    read=settings.llm_timeout,
-                    write=5.0,
-                    pool=5.0,
-                )
-            ) as client:
-                resp = await client.post(
+            async with _LLM_SEMAPHORE:
+                resp = await get_http_client().post(
                     f"{self.base_url}/api/generate",
                     json={
                         "model": self.model,
@@ -454,16 +456,22 @@ Règles :
                             "num_predict": num_predict,
                         },
                     },
+                    timeout=httpx.Timeout(
+                        connect=5.0,
+                        read=settings.llm_timeout,
+                        write=5.0,
+                        pool=5.0,
+                    ),
+                )
+            if resp.status_code != 200:
+                logger.warning(
+                    "ollama_error",
+                    status=resp.status_code,
+                    body=resp.text[:200],
                 )
-                if resp.status_code != 200:
-                    logger.warning(
-                        "ollama_error",
-                        status=resp.status_code,
-                        body=resp.text[:200],
-                    )
-                    return None
-                data = resp.json()
-                return data.get("response", "")
+                return None
+            data = resp.json()
+            return data.get("response", "")
         except httpx.TimeoutException:
             logger.warning("ollama_timeout", model=self.model)
             return None
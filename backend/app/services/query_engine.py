@@ -13,7 +13,9 @@ Security model:
 
 from __future__ import annotations
 
+import json
 import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import date, timedelta
 from decimal import Decimal
@@ -586,6 +588,36 @@ def _default_columns(source_name: str) -> list[tuple[str, object]]:
     ]
 
 
+# ---------------------------------------------------------------------------
+# Statement cache — interactive dashboards refresh the same panels over and
+# over, so validation + SQLAlchemy statement construction is repeated work.
+# Cache the built Select (pre security-injection, which is per-request) keyed
+# by the canonical raw query. Period macros resolve relative to today at
+# compile time, so the current date is part of the key. Select objects are
+# immutable (generative API), so sharing them across requests is safe.
+# ---------------------------------------------------------------------------
+
+_STMT_CACHE_MAX = 256
+_stmt_cache: OrderedDict[str, tuple[Select, list[str]]] = OrderedDict()
+
+
+def _stmt_cache_key(raw_query: dict) -> str:
+    return f"{date.today().isoformat()}:{json.dumps(raw_query, sort_keys=True, default=str)}"
+
+
+def _stmt_cache_get(key: str) -> tuple[Select, list[str]] | None:
+    cached = _stmt_cache.get(key)
+    if cached is not None:
+        _stmt_cache.move_to_end(key)
+    return cached
+
+
+def _stmt_cache_put(key: str, value: tuple[Select, list[str]]) -> None:
+    _stmt_cache[key] = value
+    while len(_stmt_cache) > _STMT_CACHE_MAX:
+        _stmt_cache.popitem(last=False)
+
+
 # ---------------------------------------------------------------------------
 # Executor
 # ---------------------------------------------------------------------------
@@ -627,14 +659,20 @@ async def execute_query(
         data, col_names = await _execute_balance_query(db, query, context)
         return data, col_names, "-- virtual source: balance (no SQL)"
 
-    try:
-        stmt, col_names = _compile_select(query)
-    except Exception as exc:
-        raise QueryExecutionError(
-            f"Erreur de compilation : {exc}",
-            sql=None,
-            query_dsl=raw_query,
-        ) from exc
+    cache_key = _stmt_cache_key(raw_query)
+    cached = _stmt_cache_get(cache_key)
+    if cached is not None:
+        stmt, col_names = cached
+    else:
+        try:
+            stmt, col_names = _compile_select(query)
+        except Exception as exc:
+            raise QueryExecutionError(
+                f"Erreur de compilation : {exc}",
+                sql=None,
+                query_dsl=raw_query,
+            ) from exc
+        _stmt_cache_put(cache_key, (stmt, col_names))
 
     # ---- SECURITY: inject context (always) ----
     stmt = stmt.where(Transaction.account_id.in_(context.account_ids))
@@ -3,6 +3,11 @@
 Manages CRUD operations on rules and applies them to transactions.
 """
 
+import re
+from collections.abc import Callable
+from collections import OrderedDict
+from dataclasses import dataclass
+
 import structlog
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,6 +23,60 @@ from app.schemas.classification_rule import RuleCreate, RuleUpdate
 logger = structlog.get_logger()
 
 
+@dataclass(frozen=True)
+class CompiledRule:
+    """Rule with its matcher resolved once, before the transaction loop.
+
+    The match callable takes an already-lowercased label, so the inner loop
+    does no per-rule dispatch on match_type and no repeated lowercasing.
+    """
+
+    category_id: int
+    custom_label: str | None
+    match: Callable[[str], bool]
+
+
+def _compile_rule(rule: ClassificationRule) -> CompiledRule:
+    """Bind the cheapest matcher for a rule's match_type."""
+    pattern = rule.pattern.lower()
+    if rule.match_type == "exact":
+        match = pattern.__eq__
+    elif rule.match_type == "starts_with":
+        def match(label: str, _prefix: str = pattern) -> bool:
+            return label.startswith(_prefix)
+    else:  # contains (default)
+        def match(label: str, _needle: str = pattern) -> bool:
+            return _needle in label
+    return CompiledRule(rule.category_id, rule.custom_label, match)
+
+
+# Prefilter cache: rule-set version → compiled alternation of every pattern.
+# One C-level scan decides whether a label can match any rule at all; labels
+# that match nothing (the common case) never enter the per-rule loop. Bounded
+# LRU since the key changes whenever a rule is edited.
+_PREFILTER_CACHE_MAX = 64
+_prefilter_cache: OrderedDict[tuple, re.Pattern] = OrderedDict()
+
+
+def _get_prefilter(rules: list[ClassificationRule]) -> re.Pattern:
+    """Compiled `pattern1|pattern2|...` alternation for a rule set (cached).
+
+    A pattern's presence as a substring is a necessary condition for all three
+    match types (exact, starts_with, contains), so a miss here is definitive.
+    """
+    key = tuple((rule.id, rule.updated_at) for rule in rules)
+    cached = _prefilter_cache.get(key)
+    if cached is not None:
+        _prefilter_cache.move_to_end(key)
+        return cached
+
+    pattern = re.compile("|".join(re.escape(rule.pattern.lower()) for rule in rules))
+    if len(_prefilter_cache) >= _PREFILTER_CACHE_MAX:
+        _prefilter_cache.popitem(last=False)
+    _prefilter_cache[key] = pattern
+    return pattern
+
+
 class RuleService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -66,7 +125,6 @@ class RuleService:
         )
         self.db.add(rule)
         await self.db.flush()
-        await self.db.refresh(rule)
 
         cat = await self.db.get(Category, rule.category_id)
         return {
@@ -91,7 +149,6 @@ class RuleService:
         for key, value in update_data.items():
             setattr(rule, key, value)
         await self.db.flush()
-        await self.db.refresh(rule)
 
         cat = await self.db.get(Category, rule.category_id)
         return {
@@ -117,9 +174,16 @@ class RuleService:
 
     # ── Rule Engine ────────────────────────────────────
 
-    async def apply_rules(self, user: User, account_id: int | None = None) -> dict:
+    async def apply_rules(
+        self,
+        user: User,
+        account_id: int | None = None,
+        only_ids: list[int] | None = None,
+    ) -> dict:
         """Apply all active rules to uncategorized transactions.
 
+        only_ids restricts the scan to a known set (e.g. rows a just-finished
+        import created) instead of every uncategorized transaction.
         Returns {applied, total_uncategorized}.
         """
         # Load active rules ordered by priority
@@ -134,15 +198,26 @@ class RuleService:
         if not rules:
             return {"applied": 0, "total_uncategorized": 0}
 
-        # Load uncategorized transactions
-        user_accounts = select(Account.id).where(Account.user_id == user.id)
-        txn_query = select(Transaction).where(
-            Transaction.account_id.in_(user_accounts),
-            Transaction.category_id.is_(None),
-            Transaction.deleted_at.is_(None),
+        # Load uncategorized transactions. Explicit join rather than an
+        # ownership IN-subquery: the planner then reliably drives from the
+        # account index into the transaction indexes instead of occasionally
+        # materializing the id list first.
+        txn_query = (
+            select(Transaction)
+            .join(Account, Account.id == Transaction.account_id)
+            .where(
+                Account.user_id == user.id,
+                Transaction.category_id.is_(None),
+                Transaction.deleted_at.is_(None),
+            )
         )
         if account_id:
             txn_query = txn_query.where(Transaction.account_id == account_id)
+        if only_ids is not None:
+            txn_query = txn_query.where(Transaction.id.in_(only_ids))
+        # id order keeps row-lock acquisition monotonic; the post-import
+        # embedding pass updates the same rows concurrently.
+        txn_query = txn_query.order_by(Transaction.id)
 
         result = await self.db.execute(txn_query)
         transactions = list(result.scalars().all())
@@ -150,9 +225,14 @@ class RuleService:
         total_uncategorized = len(transactions)
         applied = 0
 
+        compiled = [_compile_rule(rule) for rule in rules]
+        prefilter = _get_prefilter(rules)
         for txn in transactions:
-            for rule in rules:
-                if self._matches(txn.label_raw, rule.pattern, rule.match_type):
+            label = txn.label_raw.lower()
+            if prefilter.search(label) is None:
+                continue
+            for rule in compiled:
+                if rule.match(label):
                     txn.category_id = rule.category_id
                     txn.ai_confidence = "rule"
                     if rule.custom_label:
@@ -177,24 +257,25 @@ class RuleService:
 
         Returns the number of transactions updated.
         """
-        user_accounts = select(Account.id).where(Account.user_id == user.id)
-
         result = await self.db.execute(
-            select(Transaction).where(
-                Transaction.account_id.in_(user_accounts),
+            select(Transaction)
+            .join(Account, Account.id == Transaction.account_id)
+            .where(
+                Account.user_id == user.id,
                 Transaction.category_id.is_(None),
                 Transaction.deleted_at.is_(None),
             )
         )
         transactions = result.scalars().all()
 
+        compiled = _compile_rule(rule)
         count = 0
         for txn in transactions:
-            if self._matches(txn.label_raw, rule.pattern, rule.match_type):
-                txn.category_id = rule.category_id
+            if compiled.match(txn.label_raw.lower()):
+                txn.category_id = compiled.category_id
                 txn.ai_confidence = "rule"
-                if rule.custom_label:
-                    txn.label_clean = rule.custom_label
+                if compiled.custom_label:
+                    txn.label_clean = compiled.custom_label
                 count += 1
 
         await self.db.flush()
@@ -230,7 +311,6 @@ class RuleService:
                 existing.custom_label = custom_label
             existing.is_active = True
             await self.db.flush()
-            await self.db.refresh(existing)
             return existing
 
         rule = ClassificationRule(
@@ -245,24 +325,10 @@ class RuleService:
         )
         self.db.add(rule)
         await self.db.flush()
-        await self.db.refresh(rule)
         return rule
 
     # ── Helpers ─────────────────────────────────────────
 
-    @staticmethod
-    def _matches(label: str, pattern: str, match_type: str) -> bool:
-        """Check if a transaction label matches a rule pattern."""
-        label_lower = label.lower()
-        pattern_lower = pattern.lower()
-
-        if match_type == "exact":
-            return label_lower == pattern_lower
-        elif match_type == "starts_with":
-            return label_lower.startswith(pattern_lower)
-        else:  # contains (default)
-            return pattern_lower in label_lower
-
     async def _get_user_rule(self, rule_id: int, user: User) -> ClassificationRule:
         """Fetch a rule and verify ownership."""
         result = await self.db.execute(
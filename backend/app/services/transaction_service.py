@@ -1,14 +1,15 @@
 """Transaction management service."""
 
+import base64
 import hashlib
 from datetime import date
 from decimal import Decimal
 from math import ceil
 
-from sqlalchemy import case, func, literal_column, or_, select
+from sqlalchemy import case, func, literal_column, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.exceptions import ForbiddenError, NotFoundError
+from app.core.exceptions import ForbiddenError, NotFoundError, ValidationError
 from app.models.account import Account
 from app.models.category import Category
 from app.models.transaction import Transaction
@@ -16,6 +17,45 @@ from app.models.user import User
 from app.schemas.transaction import TransactionCreate, TransactionUpdate
 
 
+# Columns returned by list_transactions. Selecting plain columns (Core rows)
+# instead of Transaction entities skips ORM identity-map bookkeeping and the
+# embedding vector on the hottest read endpoint; the LEFT JOIN resolves the
+# category name in the same round trip.
+_LIST_COLUMNS = (
+    Transaction.id,
+    Transaction.account_id,
+    Transaction.date,
+    Transaction.value_date,
+    Transaction.label_raw,
+    Transaction.label_clean,
+    Transaction.amount,
+    Transaction.currency,
+    Transaction.category_id,
+    Category.name.label("category_name"),
+    Transaction.subcategory,
+    Transaction.notes,
+    Transaction.tags,
+    Transaction.source,
+    Transaction.ai_confidence,
+    Transaction.parsed_metadata,
+    Transaction.created_at,
+)
+
+
+def _encode_cursor(txn_date: date, txn_id: int) -> str:
+    """Opaque keyset cursor for the default (date, id) sort order."""
+    return base64.urlsafe_b64encode(f"{txn_date.isoformat()}:{txn_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        date_part, id_part = raw.split(":")
+        return date.fromisoformat(date_part), int(id_part)
+    except ValueError as e:  # bad base64, bad date, non-int id
+        raise ValidationError("Curseur de pagination invalide.") from e
+
+
 class TransactionService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -34,13 +74,25 @@ class TransactionService:
         search: str | None = None,
         sort_by: str = "date",
         sort_order: str = "desc",
+        cursor: str | None = None,
     ) -> dict:
-        """List transactions with pagination and filters."""
-        # Base query: only user's accounts
-        user_accounts = select(Account.id).where(Account.user_id == user.id)
-        query = select(Transaction).where(
-            Transaction.account_id.in_(user_accounts),
-            Transaction.deleted_at.is_(None),
+        """List transactions with pagination and filters.
+
+        With a cursor (keyset on (date, id)), the query seeks straight to the
+        last seen row instead of scanning and discarding OFFSET rows — deep
+        pages cost the same as page 1. page/per_page remains the fallback for
+        shallow pages and non-date sorts.
+        """
+        # Base query: only user's accounts (explicit join, not an ownership
+        # IN-subquery, so the planner drives from the account index)
+        query = (
+            select(*_LIST_COLUMNS)
+            .join(Account, Account.id == Transaction.account_id)
+            .join(Category, Category.id == Transaction.category_id, isouter=True)
+            .where(
+                Account.user_id == user.id,
+                Transaction.deleted_at.is_(None),
+            )
         )
 
         # Apply filters
@@ -56,28 +108,51 @@ class TransactionService:
             query = query.where(Transaction.amount >= amount_min)
         if amount_max is not None:
             query = query.where(Transaction.amount <= amount_max)
-        if search:
+        if search and search.strip():
+            # ILIKE '%term%' is answered by the trigram GIN indexes on
+            # label_raw/label_clean (migration 010) — an index probe instead
+            # of a sequential scan, with unchanged substring semantics.
+            term = search.strip()
             search_filter = or_(
-                Transaction.label_raw.ilike(f"%{search}%"),
-                Transaction.label_clean.ilike(f"%{search}%"),
+                Transaction.label_raw.ilike(f"%{term}%"),
+                Transaction.label_clean.ilike(f"%{term}%"),
             )
             query = query.where(search_filter)
 
-        # Count total + aggregate income/expenses in one query
-        sub = query.subquery()
-        agg_query = select(
-            func.count().label("total"),
-            func.sum(
-                case((sub.c.amount > 0, sub.c.amount), else_=Decimal("0"))
-            ).label("total_income"),
-            func.sum(
-                case((sub.c.amount < 0, sub.c.amount), else_=Decimal("0"))
-            ).label("total_expenses"),
-        ).select_from(sub)
-        agg_row = (await self.db.execute(agg_query)).one()
-        total = agg_row.total or 0
-        total_income = float(agg_row.total_income or 0)
-        total_expenses = float(abs(agg_row.total_expenses or 0))
+        use_keyset = cursor is not None and sort_by == "date"
+
+        if use_keyset:
+            # Totals must cover the full filtered set; on cursor pages the
+            # seek predicate below hides earlier rows from a window, so keep
+            # the separate aggregate query here.
+            sub = query.subquery()
+            agg_query = select(
+                func.count().label("total"),
+                func.sum(
+                    case((sub.c.amount > 0, sub.c.amount), else_=Decimal("0"))
+                ).label("total_income"),
+                func.sum(
+                    case((sub.c.amount < 0, sub.c.amount), else_=Decimal("0"))
+                ).label("total_expenses"),
+            ).select_from(sub)
+            agg_row = (await self.db.execute(agg_query)).one()
+            total = agg_row.total or 0
+            total_income = float(agg_row.total_income or 0)
+            total_expenses = float(abs(agg_row.total_expenses or 0))
+        else:
+            # OVER () windows see the whole filtered set before LIMIT/OFFSET,
+            # so page rows and totals come back in one round trip.
+            query = query.add_columns(
+                func.count().over().label("_total"),
+                func.sum(Transaction.amount)
+                .filter(Transaction.amount > 0)
+                .over()
+                .label("_income"),
+                func.sum(Transaction.amount)
+                .filter(Transaction.amount < 0)
+                .over()
+                .label("_expenses"),
+            )
 
         # Sorting
         sort_column = getattr(Transaction, sort_by, Transaction.date)
@@ -86,40 +161,53 @@ class TransactionService:
         else:
             query = query.order_by(sort_column.asc(), Transaction.id.asc())
 
-        # Pagination
-        offset = (page - 1) * per_page
-        query = query.offset(offset).limit(per_page)
+        # Pagination: keyset seek when a cursor is provided (cursors are only
+        # issued for the (date, id) sort, where the row comparison matches the
+        # ORDER BY and Postgres can use the index directly); OFFSET otherwise.
+        if use_keyset:
+            cursor_key = _decode_cursor(cursor)
+            keyset = tuple_(Transaction.date, Transaction.id)
+            query = query.where(keyset < cursor_key if sort_order == "desc" else keyset > cursor_key)
+            # Fetch one extra row to know whether a next page exists.
+            query = query.limit(per_page + 1)
+        else:
+            query = query.offset((page - 1) * per_page).limit(per_page)
 
         result = await self.db.execute(query)
-        transactions = result.scalars().all()
-
-        # Enrich with category name
-        enriched = []
-        for txn in transactions:
-            data = {
-                "id": txn.id,
-                "account_id": txn.account_id,
-                "date": txn.date,
-                "value_date": txn.value_date,
-                "label_raw": txn.label_raw,
-                "label_clean": txn.label_clean,
-                "amount": txn.amount,
-                "currency": txn.currency,
-                "category_id": txn.category_id,
-                "category_name": None,
-                "subcategory": txn.subcategory,
-                "notes": txn.notes,
-                "tags": txn.tags,
-                "source": txn.source,
-                "ai_confidence": txn.ai_confidence,
-                "parsed_metadata": txn.parsed_metadata,
-                "created_at": txn.created_at,
-            }
-            if txn.category_id:
-                cat = await self.db.get(Category, txn.category_id)
-                if cat:
-                    data["category_name"] = cat.name
-            enriched.append(data)
+        rows = result.mappings().all()
+
+        if use_keyset:
+            enriched = [dict(row) for row in rows]
+        else:
+            if rows:
+                total = rows[0]["_total"]
+                total_income = float(rows[0]["_income"] or 0)
+                total_expenses = float(abs(rows[0]["_expenses"] or 0))
+            else:
+                # Empty page (past the end, or no matches): the window never
+                # materialized, so count the filtered set directly.
+                total = (
+                    await self.db.execute(
+                        select(func.count()).select_from(query.limit(None).offset(None).subquery())
+                    )
+                ).scalar() or 0
+                total_income = 0.0
+                total_expenses = 0.0
+            enriched = [
+                {k: v for k, v in row.items() if not k.startswith("_")} for row in rows
+            ]
+
+        has_more = False
+        if use_keyset and len(enriched) > per_page:
+            enriched = enriched[:per_page]
+            has_more = True
+        elif not use_keyset:
+            has_more = (page - 1) * per_page + len(enriched) < total
+
+        next_cursor = None
+        if sort_by == "date" and enriched and has_more:
+            last = enriched[-1]
+            next_cursor = _encode_cursor(last["date"], last["id"])
 
         return {
             "data": enriched,
@@ -128,6 +216,7 @@ class TransactionService:
                 "page": page,
                 "per_page": per_page,
                 "pages": ceil(total / per_page) if per_page else 0,
+                "next_cursor": next_cursor,
                 "total_income": total_income,
                 "total_expenses": total_expenses,
                 "total_net": total_income - total_expenses,
@@ -209,15 +298,17 @@ class TransactionService:
     async def _cashflow_monthly(self, base_filter: list) -> list[dict]:
         month_col = func.date_trunc("month", Transaction.date).label("month")
 
+        # FILTER (WHERE ...) aggregates: Postgres skips non-matching rows
+        # instead of summing a CASE that returns 0 for them.
         query = (
             select(
                 month_col,
-                func.sum(
-                    case((Transaction.amount > 0, Transaction.amount), else_=Decimal("0"))
-                ).label("income"),
-                func.sum(
-                    case((Transaction.amount < 0, Transaction.amount), else_=Decimal("0"))
-                ).label("expenses"),
+                func.sum(Transaction.amount)
+                .filter(Transaction.amount > 0)
+                .label("income"),
+                func.sum(Transaction.amount)
+                .filter(Transaction.amount < 0)
+                .label("expenses"),
                 func.count().label("count"),
             )
             .where(*base_filter)
@@ -244,16 +335,21 @@ class TransactionService:
     ) -> list[dict]:
         day_col = Transaction.date.label("day")
 
+        # Running total as a window over the daily sums, so Postgres returns
+        # the cumulative directly; Python just offsets it by initial_balance.
         query = (
             select(
                 day_col,
                 func.sum(Transaction.amount).label("net"),
-                func.sum(
-                    case((Transaction.amount > 0, Transaction.amount), else_=Decimal("0"))
-                ).label("income"),
-                func.sum(
-                    case((Transaction.amount < 0, Transaction.amount), else_=Decimal("0"))
-                ).label("expenses"),
+                func.sum(func.sum(Transaction.amount))
+                .over(order_by=Transaction.date)
+                .label("cumulative"),
+                func.sum(Transaction.amount)
+                .filter(Transaction.amount > 0)
+                .label("income"),
+                func.sum(Transaction.amount)
+                .filter(Transaction.amount < 0)
+                .label("expenses"),
                 func.count().label("count"),
             )
             .where(*base_filter)
@@ -264,21 +360,17 @@ class TransactionService:
         result = await self.db.execute(query)
         rows = result.all()
 
-        # Compute running cumulative total starting from the account's initial_balance
-        cumulative = initial_balance
-        data = []
-        for row in rows:
-            net = row.net or Decimal("0")
-            cumulative += net
-            data.append({
+        return [
+            {
                 "date": row.day.isoformat(),
-                "net": float(net),
+                "net": float(row.net or 0),
                 "income": float(row.income or 0),
                 "expenses": float(abs(row.expenses or 0)),
-                "cumulative": float(cumulative),
+                "cumulative": float(initial_balance + (row.cumulative or 0)),
                 "count": row.count,
-            })
-        return data
+            }
+            for row in rows
+        ]
 
     async def get_balance_at_date(
         self,
@@ -290,24 +382,25 @@ class TransactionService:
         clauses = [Account.user_id == user.id, Account.status == "active"]
         if account_id:
             clauses.append(Account.id == account_id)
-        result = await self.db.execute(select(Account.id).where(*clauses))
-        account_ids = [r for r in result.scalars().all()]
-
-        total = Decimal("0")
-        for acc_id in account_ids:
-            acct = await self.db.get(Account, acc_id)
-            if not acct:
-                continue
-            txn_sum_result = await self.db.execute(
-                select(func.coalesce(func.sum(Transaction.amount), 0)).where(
-                    Transaction.account_id == acc_id,
-                    Transaction.date <= date_at,
-                    Transaction.deleted_at.is_(None),
-                )
+
+        # Both sums as scalar subqueries in one round-trip, instead of a
+        # per-account loop of ORM get + SUM query.
+        initial_sum = (
+            select(func.coalesce(func.sum(Account.initial_balance), 0))
+            .where(*clauses)
+            .scalar_subquery()
+        )
+        txn_sum = (
+            select(func.coalesce(func.sum(Transaction.amount), 0))
+            .where(
+                Transaction.account_id.in_(select(Account.id).where(*clauses)),
+                Transaction.date <= date_at,
+                Transaction.deleted_at.is_(None),
             )
-            txn_sum = txn_sum_result.scalar() or Decimal("0")
-            total += acct.initial_balance + txn_sum
-        return total
+            .scalar_subquery()
+        )
+        result = await self.db.execute(select(initial_sum + txn_sum))
+        return result.scalar() or Decimal("0")
 
     async def create_transaction(self, data: TransactionCreate, user: User) -> Transaction:
         """Create a transaction manually."""
@@ -328,7 +421,6 @@ class TransactionService:
         )
         self.db.add(txn)
         await self.db.flush()
-        await self.db.refresh(txn)
         return txn
 
     async def get_transaction(self, transaction_id: int, user: User) -> Transaction:
@@ -388,7 +480,6 @@ class TransactionService:
         for key, value in update_data.items():
             setattr(txn, key, value)
         await self.db.flush()
-        await self.db.refresh(txn)
 
         # Build enriched response
         cat_name = None
@@ -1,7 +1,9 @@
 """File parsers for transaction import (CSV, Excel, OFX/XML).
 
 Each parser returns a list[ParsedTransaction] — a uniform intermediate
-representation consumed by ImportService.
+representation consumed by ImportService. Parsers accept either raw bytes or
+a binary file object (e.g. a SpooledTemporaryFile from a streamed upload),
+so large files never need to be materialized as a single bytes object.
 """
 
 from __future__ import annotations
@@ -11,10 +13,29 @@ import io
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
+from typing import BinaryIO
 
 import openpyxl
 from ofxparse import OfxParser
 
+FileSource = bytes | bytearray | BinaryIO
+
+
+def _to_fileobj(source: FileSource) -> BinaryIO:
+    """Return a rewound binary file object for bytes or file-like input."""
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+
+def _read_bytes(source: FileSource) -> bytes:
+    """Return the full content as bytes (for parsers that need decoding)."""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    source.seek(0)
+    return source.read()
+
 
 @dataclass
 class ParsedTransaction:
@@ -34,12 +55,12 @@ class ParsedTransaction:
 # OFX / XML parser
 # ---------------------------------------------------------------------------
 
-def parse_ofx(content: bytes) -> list[ParsedTransaction]:
+def parse_ofx(source: FileSource) -> list[ParsedTransaction]:
     """Parse an OFX/QFX file and return a list of ParsedTransaction.
 
     Supports OFX 1.x (SGML) and OFX 2.x (XML) via ofxparse.
     """
-    ofx = OfxParser.parse(io.BytesIO(content))
+    ofx = OfxParser.parse(_to_fileobj(source))
 
     txns: list[ParsedTransaction] = []
     for account in _iter_accounts(ofx):
@@ -83,13 +104,14 @@ def _iter_accounts(ofx):
         yield ofx.account
 
 
-def extract_ofx_account_info(content: bytes) -> dict | None:
+def extract_ofx_account_info(source: FileSource) -> dict | None:
     """Extract bank account info from OFX/QFX file (BANKACCTFROM section).
 
     Returns None for non-OFX files or if parsing fails.
     """
     import re
 
+    content = _read_bytes(source)
     ext = _detect_ofx_from_content(content)
     if not ext:
         return None
@@ -185,22 +207,58 @@ def _detect_ofx_from_content(content: bytes) -> str | None:
 # CSV parser
 # ---------------------------------------------------------------------------
 
-def parse_csv(content: bytes) -> list[ParsedTransaction]:
-    """Parse CSV content. Auto-detects encoding and separator."""
-    text = _decode(content)
-
-    # Detect separator
+def _detect_csv_separator(text: str) -> str:
+    """Detect the column separator from the first line."""
     first_line = text.split("\n")[0]
     separator = ";"  # default for French bank exports
     if first_line.count(",") > first_line.count(";"):
         separator = ","
     if first_line.count("\t") > first_line.count(separator):
         separator = "\t"
+    return separator
+
+
+# Column names the normalizer actually reads. Bank exports often carry a
+# dozen extra columns; binding the relevant positions once per file keeps the
+# row loop from building and re-normalizing a full dict per row.
+_RELEVANT_COLUMNS = frozenset({
+    "date", "date operation", "date_operation", "date d'operation", "date comptable",
+    "amount", "montant", "debit", "credit",
+    "label", "libelle", "description", "libelle operation", "libelle_operation",
+})
+
+
+def _make_row_normalizer(headers: list[str]):
+    """Bind relevant column indexes once; returns a row-tuple → dict|None function.
+
+    Keeps _normalize_csv_row's exact fallback semantics (per-row candidate
+    chains, dropped empty cells) while touching only the cells it can use.
+    """
+    positions = [(h, i) for i, h in enumerate(headers) if h in _RELEVANT_COLUMNS]
+
+    def normalize(row) -> dict | None:
+        subset = {
+            name: row[i] for name, i in positions if i < len(row) and row[i] is not None
+        }
+        return _normalize_csv_row(subset)
+
+    return normalize
+
+
+def parse_csv(source: FileSource) -> list[ParsedTransaction]:
+    """Parse CSV content. Auto-detects encoding and separator."""
+    text = _decode(_read_bytes(source))
+    separator = _detect_csv_separator(text)
+
+    reader = csv.reader(io.StringIO(text), delimiter=separator)
+    header = next(reader, None)
+    if not header:
+        return []
+    normalize = _make_row_normalizer([h.strip().lower() for h in header])
 
-    reader = csv.DictReader(io.StringIO(text), delimiter=separator)
     txns: list[ParsedTransaction] = []
     for row in reader:
-        normalized = _normalize_csv_row(row)
+        normalized = normalize(row)
         if normalized:
             txns.append(
                 ParsedTransaction(
@@ -217,9 +275,9 @@ def parse_csv(content: bytes) -> list[ParsedTransaction]:
 # Excel parser
 # ---------------------------------------------------------------------------
 
-def parse_excel(content: bytes) -> list[ParsedTransaction]:
+def parse_excel(source: FileSource) -> list[ParsedTransaction]:
     """Parse Excel (.xlsx) content."""
-    wb = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+    wb = openpyxl.load_workbook(_to_fileobj(source), read_only=True, data_only=True)
     ws = wb.active
     if ws is None:
         raise ValueError("Le fichier Excel est vide.")
@@ -231,10 +289,10 @@ def parse_excel(content: bytes) -> list[ParsedTransaction]:
         raise ValueError("Le fichier Excel n'a pas d'en-tête.")
 
     headers = [str(h).strip().lower() if h else f"col_{i}" for i, h in enumerate(header)]
+    normalize = _make_row_normalizer(headers)
     txns: list[ParsedTransaction] = []
     for raw_row in rows_iter:
-        row_dict = dict(zip(headers, raw_row))
-        normalized = _normalize_csv_row(row_dict)
+        normalized = normalize(raw_row)
         if normalized:
             txns.append(
                 ParsedTransaction(
@@ -248,6 +306,76 @@ def parse_excel(content: bytes) -> list[ParsedTransaction]:
     return txns
 
 
+# ---------------------------------------------------------------------------
+# Count-only fast paths (import preview)
+# ---------------------------------------------------------------------------
+# The preview endpoint only needs a row count; building a ParsedTransaction
+# per row just to call len() wastes CPU and memory on large files.
+
+def sniff_format(source: FileSource) -> str | None:
+    """Best-effort content sniff from the first bytes: "excel", "ofx" or "csv".
+
+    Cheap enough to run before any parsing, so a mislabeled upload (say a PDF
+    renamed to .csv) is rejected immediately instead of after a full parse
+    attempt. Returns None when the content matches nothing supported.
+    """
+    stream = _to_fileobj(source)
+    head = stream.read(512)
+    stream.seek(0)
+    # xlsx is a zip archive; legacy xls is an OLE2 compound document
+    if head[:4] == b"PK\x03\x04" or head[:8] == b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1":
+        return "excel"
+    if _detect_ofx_from_content(head):
+        return "ofx"
+    # Plain text without NUL bytes: plausibly CSV
+    if b"\x00" not in head:
+        return "csv"
+    return None
+
+
+def count_rows_ofx(source: FileSource) -> int:
+    """Count transactions (STMTTRN blocks) without parsing the file.
+
+    Works for OFX 1.x (SGML) and 2.x (XML) alike: each transaction opens one
+    <STMTTRN> tag. The stream is scanned in 64 KiB chunks with a small overlap
+    so a tag split across a chunk boundary is still counted; memory stays flat.
+    """
+    needle = b"<stmttrn>"
+    overlap = len(needle) - 1
+    stream = _to_fileobj(source)
+    count = 0
+    tail = b""
+    while chunk := stream.read(64 * 1024):
+        buf = tail + chunk.lower()
+        count += buf.count(needle)
+        tail = buf[-overlap:]
+    return count
+
+
+def count_rows_csv(source: FileSource) -> int:
+    """Count non-empty data rows (header excluded) without normalizing them.
+
+    csv.reader keeps quoted newlines inside one row, so the count matches the
+    full parser's row iteration without building per-row dicts.
+    """
+    text = _decode(_read_bytes(source))
+    reader = csv.reader(io.StringIO(text), delimiter=_detect_csv_separator(text))
+    rows = sum(1 for row in reader if any(cell.strip() for cell in row))
+    return max(0, rows - 1)
+
+
+def count_rows_excel(source: FileSource) -> int:
+    """Count data rows from read-only worksheet dimensions (header excluded)."""
+    wb = openpyxl.load_workbook(_to_fileobj(source), read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        if ws is None:
+            return 0
+        return max(0, (ws.max_row or 0) - 1)
+    finally:
+        wb.close()
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -0,0 +1,34 @@
+"""Add pg_trgm GIN indexes for transaction label search.
+
+The search filter in list_transactions runs ILIKE '%term%' on label_raw and
+label_clean, which sequential-scans the whole table. gin_trgm_ops indexes let
+Postgres answer those ILIKE patterns with trigram index probes instead.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-08-28
+"""
+
+from alembic import op
+
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_transactions_label_raw_trgm "
+        "ON transactions USING gin (label_raw gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_transactions_label_clean_trgm "
+        "ON transactions USING gin (label_clean gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_label_clean_trgm", table_name="transactions")
+    op.drop_index("ix_transactions_label_raw_trgm", table_name="transactions")
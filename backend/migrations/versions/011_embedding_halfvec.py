@@ -0,0 +1,32 @@
+"""Store transaction embeddings as halfvec (FP16) instead of vector (FP32).
+
+A 384-dim FP32 vector weighs 1.5 KB per row; halfvec halves that. Clustering
+pulls thousands of vectors per request, so this halves its dominant I/O cost.
+Cosine similarity is scale-free and MiniLM components fit comfortably in
+FP16 range, so the precision loss is negligible. Requires pgvector >= 0.7.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-08-28
+"""
+
+from alembic import op
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE transactions "
+        "ALTER COLUMN embedding TYPE halfvec(384) USING embedding::halfvec(384)"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE transactions "
+        "ALTER COLUMN embedding TYPE vector(384) USING embedding::vector(384)"
+    )
@@ -0,0 +1,47 @@
+"""Partial indexes for the transaction hot paths.
+
+Every read path filters deleted_at IS NULL, so the (account_id, date DESC)
+index is rebuilt as a partial: same lookups, smaller index, no dead rows.
+Two tiny partials cover the backlog scans — parse_labels reads rows with
+parsed_metadata IS NULL and compute_missing_embeddings reads rows with
+embedding IS NULL; both indexes only ever contain unprocessed rows.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-08-28
+"""
+
+from alembic import op
+
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_transactions_account_date")
+    op.execute(
+        "CREATE INDEX idx_transactions_account_date "
+        "ON transactions (account_id, date DESC) WHERE deleted_at IS NULL"
+    )
+    op.execute(
+        "CREATE INDEX ix_transactions_unparsed "
+        "ON transactions (account_id) "
+        "WHERE parsed_metadata IS NULL AND deleted_at IS NULL"
+    )
+    op.execute(
+        "CREATE INDEX ix_transactions_unembedded "
+        "ON transactions (account_id) "
+        "WHERE embedding IS NULL AND deleted_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_transactions_unembedded")
+    op.execute("DROP INDEX IF EXISTS ix_transactions_unparsed")
+    op.execute("DROP INDEX IF EXISTS idx_transactions_account_date")
+    op.execute(
+        "CREATE INDEX idx_transactions_account_date "
+        "ON transactions (account_id, date DESC)"
+    )
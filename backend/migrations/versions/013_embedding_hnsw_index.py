@@ -0,0 +1,30 @@
+"""HNSW index on transaction embeddings for k-NN category suggestions.
+
+The suggestion path ranks classified transactions by cosine distance to a
+probe embedding (ORDER BY embedding <=> :v LIMIT k). Without an index that is
+a full scan of every stored vector; HNSW serves the top-k in logarithmic
+time. Partial on live rows, like the other transaction indexes.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-08-28
+"""
+
+from alembic import op
+
+revision = "013"
+down_revision = "012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX ix_transactions_embedding_hnsw "
+        "ON transactions USING hnsw (embedding halfvec_cosine_ops) "
+        "WHERE deleted_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_transactions_embedding_hnsw")